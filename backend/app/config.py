@@ -47,10 +47,15 @@ class Settings(BaseSettings):
         env="EMBEDDING_MODEL_NAME"
     )
     NER_CONFIDENCE_THRESHOLD: float = Field(default=0.80, env="NER_CONFIDENCE_THRESHOLD")
+    NER_QUANTIZE: bool = Field(default=True, env="NER_QUANTIZE")  # int8 dynamic quantization on CPU
+    NER_USE_ONNX: bool = Field(default=False, env="NER_USE_ONNX")  # requires optimum[onnxruntime]
+    EMBEDDING_QUANTIZE: bool = Field(default=True, env="EMBEDDING_QUANTIZE")  # int8 dynamic quantization on CPU
     
     # Performance settings
     MAX_CONCURRENT_USERS: int = Field(default=50, env="MAX_CONCURRENT_USERS")
     REQUEST_TIMEOUT: int = Field(default=30, env="REQUEST_TIMEOUT")
+    THREAD_POOL_SIZE: int = Field(default=32, env="THREAD_POOL_SIZE")  # Default executor for blocking I/O
+    BG_QUEUE_MULTIPLIER: int = Field(default=10, env="BG_QUEUE_MULTIPLIER")  # Queued tasks per background worker
     
     # Logging settings
     LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
@@ -5,7 +5,7 @@ import re
 import html
 import tempfile
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union, BinaryIO, Tuple, Collection
 from pathlib import Path
 
 # Try to import magic, fall back to mimetypes if not available
@@ -141,6 +141,9 @@ class InputSanitizer:
 class FileValidator:
     """Security validation for file uploads"""
     
+    # Bytes inspected for MIME sniffing and header checks on streamed sources
+    HEADER_SIZE = 64 * 1024
+    
     def __init__(self):
         if MAGIC_AVAILABLE:
             try:
@@ -153,17 +156,18 @@ class FileValidator:
     
     def validate_file_security(
         self, 
-        file_content: bytes, 
+        file_content: Union[bytes, str, os.PathLike, BinaryIO], 
         filename: str,
-        expected_mime_types: Optional[List[str]] = None
+        expected_mime_types: Optional[Collection[str]] = None
     ) -> Dict[str, Any]:
         """
         Comprehensive security validation for uploaded files
         
         Args:
-            file_content: Raw file content bytes
+            file_content: Raw file content bytes, a path to the file on disk,
+                or a seekable binary file object
             filename: Original filename
-            expected_mime_types: List of allowed MIME types (defaults to config)
+            expected_mime_types: Allowed MIME types (defaults to config)
             
         Returns:
             Dictionary with validation results
@@ -176,7 +180,7 @@ class FileValidator:
         allowed_types = expected_mime_types or settings.ALLOWED_FILE_TYPES
         
         # Validate file size
-        file_size = len(file_content)
+        file_size, header = self._read_header(file_content)
         if file_size > settings.MAX_FILE_SIZE:
             raise FileSizeError(file_size, settings.MAX_FILE_SIZE)
         
@@ -186,7 +190,10 @@ class FileValidator:
         # Detect actual MIME type
         if self.use_magic:
             try:
-                detected_mime = self.magic.from_buffer(file_content)
+                if isinstance(file_content, (str, os.PathLike)):
+                    detected_mime = self.magic.from_file(os.fspath(file_content))
+                else:
+                    detected_mime = self.magic.from_buffer(header)
             except Exception:
                 # Fallback to filename-based detection
                 detected_mime = self._detect_mime_from_filename(filename)
@@ -195,12 +202,12 @@ class FileValidator:
         
         # Validate MIME type
         if detected_mime not in allowed_types:
-            raise UnsupportedFormatError(detected_mime, allowed_types)
+            raise UnsupportedFormatError(detected_mime, sorted(allowed_types))
         
         # Additional security checks
         security_checks = {
-            "has_executable_content": self._check_executable_content(file_content),
-            "has_suspicious_headers": self._check_suspicious_headers(file_content),
+            "has_executable_content": self._check_executable_content(header),
+            "has_suspicious_headers": self._check_suspicious_headers(header),
             "filename_safe": self._validate_filename_security(filename)
         }
         
@@ -219,6 +226,25 @@ class FileValidator:
             "security_checks": security_checks
         }
     
+    def _read_header(
+        self, source: Union[bytes, str, os.PathLike, BinaryIO]
+    ) -> Tuple[int, bytes]:
+        """Return the total size and leading bytes of a file source"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return len(source), bytes(source[:self.HEADER_SIZE])
+        
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                return os.fstat(f.fileno()).st_size, f.read(self.HEADER_SIZE)
+        
+        # Seekable file object: measure, sniff the head, then rewind
+        start = source.tell()
+        size = source.seek(0, os.SEEK_END) - start
+        source.seek(start)
+        header = source.read(self.HEADER_SIZE)
+        source.seek(start)
+        return size, header
+    
     def _check_executable_content(self, content: bytes) -> bool:
         """Check for executable file signatures"""
         # Common executable file signatures
@@ -314,6 +340,19 @@ class TemporaryFileManager:
         
         return temp_path
     
+    def track(self, temp_path: str) -> str:
+        """
+        Register an existing temporary file for cleanup
+        
+        Args:
+            temp_path: Path to a file created elsewhere (e.g. a spooled upload)
+            
+        Returns:
+            The same path, for convenience
+        """
+        self.temp_files.append(temp_path)
+        return temp_path
+    
     def cleanup_temp_files(self):
         """Remove all tracked temporary files"""
         for temp_path in self.temp_files:
@@ -6,10 +6,10 @@ from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from app.config import settings
-from app.utils.logger import setup_logging, get_logger
+from app.utils.logger import setup_logging, shutdown_logging, get_logger
 from app.utils.ml_utils import model_cache  # Re-enabled for full functionality
 from app.utils.system_monitor import system_monitor
-from app.utils.async_utils import background_processor
+from app.utils.async_utils import background_processor, install_default_executor
 from app.middleware.auth import AuthMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.security import SecurityMiddleware
@@ -210,6 +210,9 @@ async def startup_event():
     """Initialize application on startup"""
     logger.info("Starting SmartResume AI Resume Analyzer")
     
+    # Size the thread pool used by asyncio.to_thread / run_in_executor(None, ...)
+    install_default_executor(settings.THREAD_POOL_SIZE)
+    
     # Initialize database service
     try:
         await db_service.initialize()
@@ -267,6 +270,9 @@ async def shutdown_event():
         logger.info("Background task processor stopped")
     except Exception as e:
         logger.error("Error stopping background processor", error=str(e))
+    
+    # Drain queued log records last so the shutdown messages above are written
+    shutdown_logging()
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -111,8 +111,8 @@ async def get_metric_history(
         history_data = [
             {
                 "value": point.value,
-                "timestamp": point.timestamp.isoformat(),
-                "labels": point.labels
+                "timestamp": point.timestamp_iso,
+                "labels": point.labels_dict
             }
             for point in metric_points
         ]
@@ -125,6 +125,11 @@ class DatabaseConnectionManager:
                             logger.error("All connection methods failed", error=str(e3))
                             raise DatabaseError(f"Failed to initialize database connection pool: {e}")
     
+    async def warm(self) -> None:
+        """Open and ping the pool's minimum number of connections"""
+        if self._pool:
+            await connection_optimizer.warm(self._pool, self._pool.get_min_size())
+    
     async def close(self) -> None:
         """Close database connection pool"""
         async with self._lock:
@@ -474,6 +479,7 @@ class DatabaseService:
     async def initialize(self) -> None:
         """Initialize database service"""
         await self.connection_manager.initialize()
+        await self.connection_manager.warm()
         logger.info("Database service initialized")
     
     async def close(self) -> None:
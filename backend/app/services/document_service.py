@@ -2,7 +2,6 @@
 Document ingestion service for processing various document formats
 """
 import os
-import tempfile
 from typing import Optional, Dict, Any, AsyncGenerator
 from abc import ABC, abstractmethod
 from fastapi import UploadFile
@@ -17,7 +16,7 @@ from app.utils.logger import get_logger
 from app.utils.async_utils import async_timer, async_pipeline
 from app.core.exceptions import DocumentProcessingError, UnsupportedFormatError
 from app.models.entities import ProcessedDocument
-from app.utils.file_utils import validate_upload_file, create_secure_temp_file
+from app.utils.file_utils import validate_upload_file
 from app.core.security import TemporaryFileManager
 
 logger = get_logger(__name__)
@@ -411,21 +410,20 @@ class DocumentService:
         
         mime_type = validation_result["detected_mime_type"]
         safe_filename = validation_result["safe_filename"]
-        content = validation_result["content"]
+        temp_file_path = validation_result["content_path"]
         
-        # Check if format is supported
-        if mime_type not in self.processors:
-            supported_types = list(self.processors.keys())
-            raise UnsupportedFormatError(
-                file_type=mime_type,
-                supported_types=supported_types
-            )
-        
-        # Create temporary file for processing with automatic cleanup
+        # The upload is already spooled to disk; make sure it gets cleaned up
         with TemporaryFileManager() as temp_manager:
-            # Extract file extension for proper handling
-            _, ext = os.path.splitext(safe_filename)
-            temp_file_path = temp_manager.create_temp_file(content, ext)
+            temp_manager.track(temp_file_path)
+            
+            # Check if format is supported
+            if mime_type not in self.processors:
+                supported_types = list(self.processors.keys())
+                raise UnsupportedFormatError(
+                    file_type=mime_type,
+                    supported_types=supported_types
+                )
+            
             processors = self.processors[mime_type]
             last_error = None
             
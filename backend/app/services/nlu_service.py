@@ -1,11 +1,15 @@
 """
 Natural Language Understanding service for resume entity extraction
 """
+import asyncio
 import re
 import json
 import os
-from typing import List, Dict, Optional, Any, Tuple, Set
+from itertools import chain
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Tuple, Set, Union, Iterable
 from collections import defaultdict
+import numpy as np
 from app.utils.logger import get_logger
 from app.utils.ml_utils import model_cache
 from app.models.entities import ResumeEntities
@@ -13,6 +17,65 @@ from app.core.exceptions import NLUProcessingError
 
 logger = get_logger(__name__)
 
+# Matches phrases such as "5 years", "10+ yrs" anywhere in the resume text
+_YEARS_RE = re.compile(r'(\d{1,2})\+?\s*(?:years?|yrs?)\b', re.IGNORECASE)
+
+# Characters the NER model should not see; the ASCII subset is replaced via a
+# str.translate table, the regex only runs for text containing non-ASCII
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-\.\@\(\)\+]')
+_SPECIAL_CHARS_TABLE = str.maketrans({
+    chr(code): ' ' for code in range(128) if _SPECIAL_CHARS_RE.match(chr(code))
+})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _take_unique(candidates: Iterable[str], limit: int) -> List[str]:
+    """Collect unique candidates in order, stopping once `limit` are found"""
+    unique: Dict[str, None] = {}
+    for candidate in candidates:
+        unique[candidate] = None
+        if len(unique) == limit:
+            break
+    return list(unique)
+
+
+@dataclass
+class TokenBatch:
+    """
+    Structure-of-arrays view of raw NER pipeline output.
+    Offsets and scores live in NumPy arrays so post-processing can use
+    vectorized masking instead of per-token dict lookups.
+    """
+    start: np.ndarray
+    end: np.ndarray
+    score: np.ndarray
+    label: np.ndarray
+    word: np.ndarray
+    
+    @classmethod
+    def from_entities(cls, entities: List[Dict[str, Any]]) -> 'TokenBatch':
+        """Build a batch from the pipeline's list-of-dicts output"""
+        return cls(
+            start=np.array([e.get('start', 0) for e in entities], dtype=np.int32),
+            end=np.array([e.get('end', 0) for e in entities], dtype=np.int32),
+            score=np.array([e.get('score', 0) for e in entities], dtype=np.float64),
+            label=np.array([e.get('entity_group', e.get('label', '')) for e in entities], dtype=object),
+            word=np.array([e.get('word', '') for e in entities], dtype=object)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.start)
+    
+    def __getitem__(self, index: np.ndarray) -> 'TokenBatch':
+        """Select tokens by boolean mask or index array"""
+        return TokenBatch(
+            start=self.start[index],
+            end=self.end[index],
+            score=self.score[index],
+            label=self.label[index],
+            word=self.word[index]
+        )
+
 
 class NERProcessor:
     """
@@ -51,7 +114,11 @@ class NERProcessor:
             cleaned_text = self._preprocess_text(text)
             
             # Run NER inference
-            logger.info("Running NER inference", text_length=len(cleaned_text))
+            logger.info(
+                "Running NER inference",
+                original_length=len(text),
+                text_length=len(cleaned_text)
+            )
             raw_entities = ner_pipeline(cleaned_text)
             
             # Filter by confidence threshold
@@ -79,17 +146,16 @@ class NERProcessor:
     
     def _preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for NER processing"""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
         # Remove special characters that might confuse the model
-        text = re.sub(r'[^\w\s\-\.\@\(\)\+]', ' ', text)
+        text = text.translate(_SPECIAL_CHARS_TABLE)
+        if not text.isascii():
+            text = _SPECIAL_CHARS_RE.sub(' ', text)
         
-        # Limit text length to prevent memory issues (max 5000 chars)
-        if len(text) > 5000:
-            text = text[:5000]
-            logger.warning("Text truncated for NER processing", original_length=len(text))
+        # Remove excessive whitespace
+        text = _WHITESPACE_RE.sub(' ', text)
         
+        # No character cap here: the pipeline tokenizer truncates at the
+        # model's maximum sequence length, i.e. on a token boundary
         return text.strip()
 
 
@@ -114,19 +180,20 @@ class EntityPostProcessor:
             'EXPERIENCE': 'experience'
         }
     
-    def process_entities(self, raw_entities: List[Dict[str, Any]]) -> ResumeEntities:
+    def process_entities(self, raw_entities: List[Dict[str, Any]], text: str = "") -> ResumeEntities:
         """
         Process raw NER entities into structured ResumeEntities.
         
         Args:
             raw_entities: Raw entities from NER model
+            text: Original resume text, scanned for years of experience
             
         Returns:
             ResumeEntities with grouped and deduplicated entities
         """
         try:
             # Group adjacent tokens
-            grouped_entities = self._group_adjacent_tokens(raw_entities)
+            grouped_entities = self._group_adjacent_tokens(TokenBatch.from_entities(raw_entities))
             
             # Categorize entities
             categorized = self._categorize_entities(grouped_entities)
@@ -141,7 +208,7 @@ class EntityPostProcessor:
             confidence_scores = self._calculate_confidence_scores(deduplicated)
             
             # Extract experience years (if available)
-            experience_years = self._extract_experience_years(raw_entities)
+            experience_years = self._extract_experience_years(text)
             
             return ResumeEntities(
                 skills=deduplicated.get('skills', []),
@@ -160,41 +227,37 @@ class EntityPostProcessor:
                 processing_stage="post_processing"
             )
     
-    def _group_adjacent_tokens(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _group_adjacent_tokens(
+        self, entities: Union[TokenBatch, List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
         """Group adjacent tokens of the same entity type into single entities"""
-        if not entities:
+        batch = entities if isinstance(entities, TokenBatch) else TokenBatch.from_entities(entities)
+        if not len(batch):
             return []
         
-        grouped = []
-        current_group = None
-        
-        for entity in sorted(entities, key=lambda x: x.get('start', 0)):
-            entity_label = entity.get('entity_group', entity.get('label', ''))
-            
-            if (current_group and 
-                current_group['entity_group'] == entity_label and
-                abs(entity.get('start', 0) - current_group.get('end', 0)) <= 2):
-                # Extend current group
-                current_group['word'] += ' ' + entity.get('word', '').replace('##', '')
-                current_group['end'] = entity.get('end', current_group['end'])
-                current_group['score'] = max(current_group['score'], entity.get('score', 0))
-            else:
-                # Start new group
-                if current_group:
-                    grouped.append(current_group)
-                
-                current_group = {
-                    'entity_group': entity_label,
-                    'word': entity.get('word', '').replace('##', ''),
-                    'start': entity.get('start', 0),
-                    'end': entity.get('end', 0),
-                    'score': entity.get('score', 0)
-                }
-        
-        if current_group:
-            grouped.append(current_group)
-        
-        return grouped
+        batch = batch[np.argsort(batch.start, kind='stable')]
+        
+        # A token starts a new group when its label changes or it is not
+        # within two characters of the previous token
+        breaks = np.ones(len(batch), dtype=bool)
+        breaks[1:] = (
+            (batch.label[1:] != batch.label[:-1]) |
+            (np.abs(batch.start[1:] - batch.end[:-1]) > 2)
+        )
+        group_starts = np.flatnonzero(breaks)
+        group_ends = np.append(group_starts[1:], len(batch))
+        group_scores = np.maximum.reduceat(batch.score, group_starts)
+        
+        return [
+            {
+                'entity_group': batch.label[first],
+                'word': ' '.join(word.replace('##', '') for word in batch.word[first:stop]),
+                'start': int(batch.start[first]),
+                'end': int(batch.end[stop - 1]),
+                'score': float(score)
+            }
+            for first, stop, score in zip(group_starts, group_ends, group_scores)
+        ]
     
     def _categorize_entities(self, entities: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """Categorize entities by type"""
@@ -262,22 +325,10 @@ class EntityPostProcessor:
             category: 0.85 for category in categorized.keys()
         }
     
-    def _extract_experience_years(self, raw_entities: List[Dict[str, Any]]) -> Optional[int]:
-        """Extract years of experience from entities (basic implementation)"""
-        # This is a simplified implementation
-        # In practice, this would require more sophisticated parsing
-        for entity in raw_entities:
-            text = entity.get('word', '').lower()
-            if 'year' in text and any(char.isdigit() for char in text):
-                # Extract first number found
-                numbers = re.findall(r'\d+', text)
-                if numbers:
-                    try:
-                        return int(numbers[0])
-                    except ValueError:
-                        continue
-        
-        return None
+    def _extract_experience_years(self, text: str) -> Optional[int]:
+        """Extract years of experience with a single scan of the resume text"""
+        match = _YEARS_RE.search(text)
+        return int(match.group(1)) if match else None
 
 
 class FallbackExtractor:
@@ -290,10 +341,13 @@ class FallbackExtractor:
         self.skills_dict = self._load_skills_dictionary()
         self.min_confidence_threshold = 0.70  # Threshold below which fallback activates
         
-        # Regex patterns for contact information
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_pattern = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
-        self.linkedin_pattern = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[A-Za-z0-9-]+/?', re.IGNORECASE)
+        # Single alternation for contact information, scanned in one pass and
+        # dispatched on the name of the group that matched
+        self.contact_pattern = re.compile(
+            r'(?P<linkedin>(?i:(?:https?://)?(?:www\.)?linkedin\.com/in/[A-Za-z0-9-]+/?))'
+            r'|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+            r'|(?P<phone>(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+        )
         
         # Common job title patterns
         self.job_title_keywords = {
@@ -303,6 +357,24 @@ class FallbackExtractor:
             'scientist', 'researcher', 'intern', 'associate', 'executive', 'officer'
         }
         
+        # Common skill spellings mapped to their canonical names
+        self.skill_aliases = {
+            'javascript': 'JavaScript',
+            'typescript': 'TypeScript',
+            'nodejs': 'Node.js',
+            'reactjs': 'React',
+            'vuejs': 'Vue.js',
+            'angularjs': 'Angular',
+            'css3': 'CSS',
+            'html5': 'HTML',
+            'postgresql': 'PostgreSQL',
+            'mysql': 'MySQL',
+            'mongodb': 'MongoDB',
+            'aws': 'AWS',
+            'gcp': 'Google Cloud',
+            'azure': 'Azure'
+        }
+        
         # Education keywords
         self.education_keywords = {
             'university', 'college', 'school', 'institute', 'academy', 'bachelor',
@@ -420,26 +492,22 @@ class FallbackExtractor:
             )
     
     def _extract_contact_info_fallback(self, text: str) -> Dict[str, str]:
-        """Extract contact information using regex patterns"""
+        """Extract contact information using a single regex scan"""
         contact_info = {}
         
-        # Extract email
-        email_matches = self.email_pattern.findall(text)
-        if email_matches:
-            contact_info['email'] = email_matches[0]
-        
-        # Extract phone
-        phone_matches = self.phone_pattern.findall(text)
-        if phone_matches:
-            # Clean up phone number
-            phone = re.sub(r'[^\d+]', '', phone_matches[0])
-            if len(phone) >= 10:
-                contact_info['phone'] = phone_matches[0]
-        
-        # Extract LinkedIn
-        linkedin_matches = self.linkedin_pattern.findall(text)
-        if linkedin_matches:
-            contact_info['linkedin'] = linkedin_matches[0]
+        for match in self.contact_pattern.finditer(text):
+            field = match.lastgroup
+            if field in contact_info:
+                continue
+            
+            value = match.group()
+            # Require at least 10 digits for phone numbers
+            if field == 'phone' and len(re.sub(r'[^\d+]', '', value)) < 10:
+                continue
+            
+            contact_info[field] = value
+            if len(contact_info) == 3:
+                break
         
         return contact_info
     
@@ -467,56 +535,30 @@ class FallbackExtractor:
     
     def _normalize_skills(self, skills: List[str]) -> List[str]:
         """Normalize and standardize skill names"""
-        normalized = []
-        seen = set()
-        
-        # Common normalizations
-        normalizations = {
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript',
-            'nodejs': 'Node.js',
-            'reactjs': 'React',
-            'vuejs': 'Vue.js',
-            'angularjs': 'Angular',
-            'css3': 'CSS',
-            'html5': 'HTML',
-            'postgresql': 'PostgreSQL',
-            'mysql': 'MySQL',
-            'mongodb': 'MongoDB',
-            'aws': 'AWS',
-            'gcp': 'Google Cloud',
-            'azure': 'Azure'
-        }
+        # Keyed by lowercased normalized name; keeps the first spelling seen
+        seen: Dict[str, str] = {}
         
         for skill in skills:
-            skill_lower = skill.lower().strip()
-            
-            # Apply normalizations
-            normalized_skill = normalizations.get(skill_lower, skill)
-            
-            if normalized_skill.lower() not in seen:
-                seen.add(normalized_skill.lower())
-                normalized.append(normalized_skill)
+            normalized_skill = self.skill_aliases.get(skill.lower().strip(), skill)
+            seen.setdefault(normalized_skill.lower(), normalized_skill)
         
-        return sorted(normalized)
+        return sorted(seen.values())
     
     def _extract_job_titles_fallback(self, text: str) -> List[str]:
         """Extract job titles using keyword matching"""
-        job_titles = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Look for lines that contain job title keywords
-            if any(keyword in line_lower for keyword in self.job_title_keywords):
-                # Clean up the line
-                cleaned_title = re.sub(r'[^\w\s]', ' ', line).strip()
-                if len(cleaned_title) > 5 and len(cleaned_title) < 100:
-                    job_titles.append(cleaned_title)
+        def candidates():
+            for line in text.split('\n'):
+                line_lower = line.lower().strip()
+                
+                # Look for lines that contain job title keywords
+                if any(keyword in line_lower for keyword in self.job_title_keywords):
+                    # Clean up the line
+                    cleaned_title = re.sub(r'[^\w\s]', ' ', line).strip()
+                    if len(cleaned_title) > 5 and len(cleaned_title) < 100:
+                        yield cleaned_title
         
-        # Remove duplicates and return first 5
-        unique_titles = list(dict.fromkeys(job_titles))[:5]
+        # Keep the first 5 unique titles
+        unique_titles = _take_unique(candidates(), 5)
         
         logger.info("Fallback job titles extraction completed", 
                    titles_found=len(unique_titles))
@@ -525,21 +567,19 @@ class FallbackExtractor:
     
     def _extract_education_fallback(self, text: str) -> List[str]:
         """Extract education information using keyword matching"""
-        education = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Look for lines that contain education keywords
-            if any(keyword in line_lower for keyword in self.education_keywords):
-                # Clean up the line
-                cleaned_education = re.sub(r'[^\w\s\-\.]', ' ', line).strip()
-                if len(cleaned_education) > 5 and len(cleaned_education) < 150:
-                    education.append(cleaned_education)
+        def candidates():
+            for line in text.split('\n'):
+                line_lower = line.lower().strip()
+                
+                # Look for lines that contain education keywords
+                if any(keyword in line_lower for keyword in self.education_keywords):
+                    # Clean up the line
+                    cleaned_education = re.sub(r'[^\w\s\-\.]', ' ', line).strip()
+                    if len(cleaned_education) > 5 and len(cleaned_education) < 150:
+                        yield cleaned_education
         
-        # Remove duplicates and return first 5
-        unique_education = list(dict.fromkeys(education))[:5]
+        # Keep the first 5 unique entries
+        unique_education = _take_unique(candidates(), 5)
         
         logger.info("Fallback education extraction completed", 
                    education_found=len(unique_education))
@@ -548,24 +588,22 @@ class FallbackExtractor:
     
     def _extract_companies_fallback(self, text: str) -> List[str]:
         """Extract company names using basic heuristics"""
-        companies = []
-        
         # Look for common company indicators
         company_indicators = ['inc', 'corp', 'ltd', 'llc', 'company', 'technologies', 'systems', 'solutions']
         
-        lines = text.split('\n')
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Look for lines with company indicators
-            if any(indicator in line_lower for indicator in company_indicators):
-                # Extract potential company name
-                cleaned_company = re.sub(r'[^\w\s\-\.]', ' ', line).strip()
-                if len(cleaned_company) > 3 and len(cleaned_company) < 100:
-                    companies.append(cleaned_company)
+        def candidates():
+            for line in text.split('\n'):
+                line_lower = line.lower().strip()
+                
+                # Look for lines with company indicators
+                if any(indicator in line_lower for indicator in company_indicators):
+                    # Extract potential company name
+                    cleaned_company = re.sub(r'[^\w\s\-\.]', ' ', line).strip()
+                    if len(cleaned_company) > 3 and len(cleaned_company) < 100:
+                        yield cleaned_company
         
-        # Remove duplicates and return first 5
-        unique_companies = list(dict.fromkeys(companies))[:5]
+        # Keep the first 5 unique companies
+        unique_companies = _take_unique(candidates(), 5)
         
         logger.info("Fallback companies extraction completed", 
                    companies_found=len(unique_companies))
@@ -583,6 +621,7 @@ class NLUService:
         self.ner_processor = NERProcessor()
         self.post_processor = EntityPostProcessor()
         self.fallback_extractor = FallbackExtractor()
+        self.min_sufficient_skills = 5  # Skip fallback when NER already found this many skills
     
     async def extract_entities(self, text: str) -> ResumeEntities:
         """
@@ -602,24 +641,43 @@ class NLUService:
             logger.info("Starting entity extraction", text_length=len(text))
             
             # Attempt NER processing first
+            fallback_future = None
             try:
                 raw_entities = await self.ner_processor.extract_entities(text)
                 
-                # Check if we should use fallback based on confidence
+                # Post-processing and fallback are CPU-bound, so run them in
+                # worker threads off the event loop. When confidence is low the
+                # fallback starts alongside post-processing, before we know
+                # whether the deduplicated NER output makes it unnecessary
+                loop = asyncio.get_running_loop()
+                post_future = loop.run_in_executor(
+                    None, self.post_processor.process_entities, raw_entities, text
+                )
                 if self.fallback_extractor.should_use_fallback(raw_entities):
+                    fallback_future = loop.run_in_executor(
+                        None, self.fallback_extractor.extract_fallback_entities, text
+                    )
+                
+                ner_entities = await post_future
+                
+                if fallback_future is not None and self._is_ner_sufficient(ner_entities):
+                    logger.info("NER output sufficient, skipping fallback extraction")
+                    fallback_future.cancel()
+                    fallback_future = None
+                
+                if fallback_future is not None:
                     logger.info("NER confidence too low, using fallback extraction")
-                    fallback_entities = self.fallback_extractor.extract_fallback_entities(text)
+                    fallback_entities = await fallback_future
                     
                     # Merge NER and fallback results
-                    processed_entities = self._merge_entities(
-                        self.post_processor.process_entities(raw_entities),
-                        fallback_entities
-                    )
+                    processed_entities = self._merge_entities(ner_entities, fallback_entities)
                 else:
                     # Use NER results with high confidence
-                    processed_entities = self.post_processor.process_entities(raw_entities)
+                    processed_entities = ner_entities
                     
             except Exception as ner_error:
+                if fallback_future is not None:
+                    fallback_future.cancel()
                 logger.warning("NER processing failed, falling back to rule-based extraction", 
                              error=str(ner_error))
                 
@@ -644,6 +702,13 @@ class NLUService:
                 processing_stage="nlu_service"
             )
     
+    def _is_ner_sufficient(self, ner_entities: ResumeEntities) -> bool:
+        """Post-processed NER output is sufficient when it has enough distinct skills and an email address"""
+        return (
+            len(ner_entities.skills) >= self.min_sufficient_skills
+            and bool(ner_entities.contact_info.get('email'))
+        )
+    
     def _merge_entities(self, ner_entities: ResumeEntities, fallback_entities: ResumeEntities) -> ResumeEntities:
         """
         Merge NER and fallback extraction results, prioritizing higher confidence results.
@@ -657,7 +722,7 @@ class NLUService:
         """
         try:
             # Merge skills (combine and deduplicate)
-            merged_skills = list(set(ner_entities.skills + fallback_entities.skills))
+            merged_skills = list(dict.fromkeys(chain(ner_entities.skills, fallback_entities.skills)))
             
             # Merge job titles (prioritize NER if available, otherwise fallback)
             merged_job_titles = ner_entities.job_titles if ner_entities.job_titles else fallback_entities.job_titles
@@ -676,7 +741,7 @@ class NLUService:
             
             # Merge confidence scores (average where both exist)
             merged_confidence_scores = {}
-            for key in set(ner_entities.confidence_scores.keys()) | set(fallback_entities.confidence_scores.keys()):
+            for key in ner_entities.confidence_scores.keys() | fallback_entities.confidence_scores.keys():
                 ner_score = ner_entities.confidence_scores.get(key, 0)
                 fallback_score = fallback_entities.confidence_scores.get(key, 0)
                 
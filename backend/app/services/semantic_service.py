@@ -11,7 +11,9 @@ import asyncio
 from functools import lru_cache
 import hashlib
 
+from app.config import settings
 from app.utils.logger import get_logger
+from app.utils.ml_utils import quantize_sentence_transformer
 from app.models.entities import CompatibilityAnalysis
 from app.core.exceptions import SemanticAnalysisError
 
@@ -33,7 +35,10 @@ class EmbeddingGenerator:
         if self._model is None:
             try:
                 logger.info("Loading sentence transformer model", model=self.model_name)
-                self._model = SentenceTransformer(self.model_name)
+                model = SentenceTransformer(self.model_name, device="cpu")
+                if settings.EMBEDDING_QUANTIZE:
+                    model = quantize_sentence_transformer(model)
+                self._model = model
                 logger.info("Successfully loaded sentence transformer model")
             except Exception as e:
                 logger.error("Failed to load sentence transformer model", error=str(e))
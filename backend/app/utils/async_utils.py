@@ -3,15 +3,25 @@ Async processing utilities for performance optimization
 """
 import asyncio
 import time
-from typing import AsyncGenerator, List, Any, Callable, Optional, Dict
+from typing import AsyncGenerator, List, Any, Callable, Optional, Dict, Iterable, Tuple
 from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from itertools import islice
 
+from app.config import settings
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Failed items are summarised in a single log entry carrying a few samples
+_ERROR_SAMPLE_LIMIT = 3
+
+
+def _log_item_errors(event: str, error_count: int, samples: List[Tuple[int, str, str]]) -> None:
+    """Emit one summary entry for the failed items of a processing run"""
+    if error_count:
+        logger.error(event, count=error_count, samples=samples)
 
 class AsyncProcessingPipeline:
     """
@@ -20,13 +30,46 @@ class AsyncProcessingPipeline:
     
     def __init__(self, max_workers: int = 4):
         self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+        # Resizable concurrency limit shared by process_with_semaphore calls
+        self._max_concurrent = 10
+        self._active = 0
+        self._condition = asyncio.Condition()
+    
+    async def set_concurrency(self, max_concurrent: int) -> None:
+        """
+        Change the concurrency limit at runtime
+        
+        Args:
+            max_concurrent: New maximum number of concurrent operations
+            
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        
+        async with self._condition:
+            self._max_concurrent = max_concurrent
+            # Waiters re-check the limit; raising it admits them immediately
+            self._condition.notify_all()
+    
+    async def _acquire_slot(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self._max_concurrent)
+            self._active += 1
+    
+    async def _release_slot(self) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(1)
     
     async def process_in_chunks(
         self, 
         data: List[Any], 
         processor: Callable,
-        chunk_size: int = 10
+        chunk_size: int = 10,
+        yield_batches: bool = False
     ) -> AsyncGenerator[Any, None]:
         """
         Process data in chunks asynchronously using generators
@@ -35,11 +78,14 @@ class AsyncProcessingPipeline:
             data: List of items to process
             processor: Async function to process each item
             chunk_size: Number of items to process in parallel
+            yield_batches: Yield lists of up to chunk_size results instead of
+                single results. Trades per-item latency for throughput when
+                the consumer aggregates results anyway.
             
         Yields:
-            Processed results as they complete
+            Processed results (or batches of results) as they complete
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         total_items = len(data)
         processed_count = 0
         
@@ -50,39 +96,53 @@ class AsyncProcessingPipeline:
             max_workers=self.max_workers
         )
         
-        # Process data in chunks
-        for i in range(0, total_items, chunk_size):
-            chunk = data[i:i + chunk_size]
-            
-            # Create tasks for the chunk
-            tasks = [processor(item) for item in chunk]
-            
-            # Process chunk concurrently
-            try:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Keep a sliding window of at most chunk_size in-flight tasks, topping
+        # it up as soon as any task finishes instead of waiting for a whole chunk
+        pending_items = enumerate(data)
+        inflight: Dict[asyncio.Future, int] = {}
+        
+        def schedule(count: int) -> None:
+            for index, item in islice(pending_items, count):
+                inflight[asyncio.ensure_future(processor(item))] = index
+        
+        schedule(chunk_size)
+        batch: List[Any] = []
+        error_count = 0
+        error_samples: List[Tuple[int, str, str]] = []
+        
+        try:
+            while inflight:
+                done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                completed = [(inflight.pop(task), task) for task in done]
+                schedule(len(completed))
                 
-                for j, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.error(
-                            "pipeline_item_failed",
-                            item_index=i + j,
-                            error=str(result)
-                        )
+                for index, task in completed:
+                    error = task.exception()
+                    if error is not None:
+                        error_count += 1
+                        if len(error_samples) < _ERROR_SAMPLE_LIMIT:
+                            error_samples.append((index, type(error).__name__, str(error)))
                         continue
                     
                     processed_count += 1
-                    yield result
+                    if not yield_batches:
+                        yield task.result()
+                        continue
                     
-            except Exception as e:
-                logger.error(
-                    "pipeline_chunk_failed",
-                    chunk_start=i,
-                    chunk_size=len(chunk),
-                    error=str(e)
-                )
-                continue
+                    batch.append(task.result())
+                    if len(batch) >= chunk_size:
+                        yield batch
+                        batch = []
+            
+            if batch:
+                yield batch
+        finally:
+            # Consumer stopped early or was cancelled; drop remaining work
+            for task in inflight:
+                task.cancel()
+            _log_item_errors("pipeline_item_errors", error_count, error_samples)
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         logger.info(
             "async_pipeline_completed",
             total_items=total_items,
@@ -91,63 +151,140 @@ class AsyncProcessingPipeline:
             items_per_second=processed_count / processing_time if processing_time > 0 else 0
         )
     
+    async def _fan_out(
+        self,
+        items: Iterable[Any],
+        processor: Callable
+    ) -> AsyncGenerator[Tuple[int, Any, Optional[BaseException]], None]:
+        """
+        Run processor over items with at most the concurrency limit in flight
+        
+        Items are pulled from the iterable lazily, so only in-flight coroutines
+        exist at any time. Yields (index, result, error) in completion order.
+        """
+        pending_items = enumerate(items)
+        inflight: Dict[asyncio.Future, int] = {}
+        
+        async def bounded_processor(item: Any) -> Any:
+            await self._acquire_slot()
+            try:
+                return await processor(item)
+            finally:
+                await self._release_slot()
+        
+        def top_up() -> None:
+            free = self._max_concurrent - len(inflight)
+            for index, item in islice(pending_items, max(free, 0)):
+                inflight[asyncio.ensure_future(bounded_processor(item))] = index
+        
+        top_up()
+        
+        try:
+            while inflight:
+                done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                completed = [(inflight.pop(task), task) for task in done]
+                top_up()
+                
+                for index, task in completed:
+                    error = task.exception()
+                    yield index, (None if error is not None else task.result()), error
+        finally:
+            # Consumer stopped early or was cancelled; drop remaining work
+            for task in inflight:
+                task.cancel()
+    
+    async def iter_with_semaphore(
+        self,
+        items: Iterable[Any],
+        processor: Callable,
+        max_concurrent: Optional[int] = None
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Process items with concurrency control, yielding results as they complete
+        
+        Args:
+            items: Iterable of items to process (consumed lazily)
+            processor: Async function to process each item
+            max_concurrent: If given, set the pipeline's shared concurrency
+                limit to this value first; otherwise the current limit applies
+            
+        Yields:
+            Successful results in completion order
+        """
+        if max_concurrent is not None:
+            await self.set_concurrency(max_concurrent)
+        
+        error_count = 0
+        error_samples: List[Tuple[int, str, str]] = []
+        
+        try:
+            async for index, result, error in self._fan_out(items, processor):
+                if error is not None:
+                    error_count += 1
+                    if len(error_samples) < _ERROR_SAMPLE_LIMIT:
+                        error_samples.append((index, type(error).__name__, str(error)))
+                    continue
+                yield result
+        finally:
+            _log_item_errors("semaphore_item_errors", error_count, error_samples)
+    
     async def process_with_semaphore(
         self,
-        items: List[Any],
+        items: Iterable[Any],
         processor: Callable,
-        max_concurrent: int = 10
+        max_concurrent: Optional[int] = None
     ) -> List[Any]:
         """
-        Process items with concurrency control using semaphore
+        Process items with concurrency control
+        
+        The limit is shared by all calls on this pipeline and can be changed
+        while processing is under way via set_concurrency(). Items are pulled
+        lazily, so at most the current limit of coroutines exist at once.
         
         Args:
-            items: List of items to process
+            items: Iterable of items to process
             processor: Async function to process each item
-            max_concurrent: Maximum number of concurrent operations
+            max_concurrent: If given, set the pipeline's shared concurrency
+                limit to this value first; otherwise the current limit applies
             
         Returns:
-            List of processed results
+            List of processed results, in input order
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        if max_concurrent is not None:
+            await self.set_concurrency(max_concurrent)
         
-        async def bounded_processor(item):
-            async with semaphore:
-                return await processor(item)
+        results: Dict[int, Any] = {}
+        total_items = 0
+        error_count = 0
+        error_samples: List[Tuple[int, str, str]] = []
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         logger.info(
             "semaphore_processing_started",
-            total_items=len(items),
-            max_concurrent=max_concurrent
+            total_items=len(items) if hasattr(items, "__len__") else None,
+            max_concurrent=self._max_concurrent
         )
         
         try:
-            results = await asyncio.gather(
-                *[bounded_processor(item) for item in items],
-                return_exceptions=True
-            )
+            async for index, result, error in self._fan_out(items, processor):
+                total_items += 1
+                if error is not None:
+                    error_count += 1
+                    if len(error_samples) < _ERROR_SAMPLE_LIMIT:
+                        error_samples.append((index, type(error).__name__, str(error)))
+                    continue
+                results[index] = result
             
-            # Filter out exceptions and log them
-            successful_results = []
-            error_count = 0
+            _log_item_errors("semaphore_item_errors", error_count, error_samples)
             
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    error_count += 1
-                    logger.error(
-                        "semaphore_item_failed",
-                        item_index=i,
-                        error=str(result)
-                    )
-                else:
-                    successful_results.append(result)
+            successful_results = [results[index] for index in sorted(results)]
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             logger.info(
                 "semaphore_processing_completed",
-                total_items=len(items),
+                total_items=total_items,
                 successful_items=len(successful_results),
                 failed_items=error_count,
                 processing_time=processing_time
@@ -162,9 +299,27 @@ class AsyncProcessingPipeline:
             )
             raise
     
-    def close(self):
-        """Close the thread pool executor"""
-        self.executor.shutdown(wait=True)
+
+
+def install_default_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Install a sized thread pool as the running event loop's default executor.
+    
+    Every asyncio.to_thread() and run_in_executor(None, ...) call in the
+    application runs on this pool.
+    
+    Args:
+        max_workers: Number of worker threads
+        
+    Returns:
+        The installed executor
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="app-io")
+    asyncio.get_running_loop().set_default_executor(executor)
+    
+    logger.info("default_executor_installed", max_workers=max_workers)
+    
+    return executor
 
 
 class ConnectionPoolOptimizer:
@@ -180,7 +335,8 @@ class ConnectionPoolOptimizer:
             "failed_connections": 0,
             "connection_wait_time": 0.0
         }
-        self._lock = asyncio.Lock()
+        # Counters are updated without a lock: there is no await between the
+        # read and write of each update, so they are atomic on the event loop
     
     @asynccontextmanager
     async def get_optimized_connection(self, pool):
@@ -193,12 +349,11 @@ class ConnectionPoolOptimizer:
         Yields:
             Database connection with performance tracking
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         connection = None
         
         try:
-            async with self._lock:
-                self.pool_stats["total_connections"] += 1
+            self.pool_stats["total_connections"] += 1
             
             # Acquire connection with timeout
             connection = await asyncio.wait_for(
@@ -206,11 +361,10 @@ class ConnectionPoolOptimizer:
                 timeout=30.0  # 30 second timeout
             )
             
-            connection_wait_time = time.time() - start_time
+            connection_wait_time = time.perf_counter() - start_time
             
-            async with self._lock:
-                self.pool_stats["active_connections"] += 1
-                self.pool_stats["connection_wait_time"] += connection_wait_time
+            self.pool_stats["active_connections"] += 1
+            self.pool_stats["connection_wait_time"] += connection_wait_time
             
             logger.debug(
                 "connection_acquired",
@@ -222,24 +376,22 @@ class ConnectionPoolOptimizer:
             yield connection
             
         except asyncio.TimeoutError:
-            async with self._lock:
-                self.pool_stats["failed_connections"] += 1
+            self.pool_stats["failed_connections"] += 1
             
             logger.error(
                 "connection_timeout",
-                wait_time=time.time() - start_time,
+                wait_time=time.perf_counter() - start_time,
                 pool_size=pool.get_size() if pool else 0
             )
             raise
             
         except Exception as e:
-            async with self._lock:
-                self.pool_stats["failed_connections"] += 1
+            self.pool_stats["failed_connections"] += 1
             
             logger.error(
                 "connection_error",
                 error=str(e),
-                wait_time=time.time() - start_time
+                wait_time=time.perf_counter() - start_time
             )
             raise
             
@@ -248,9 +400,8 @@ class ConnectionPoolOptimizer:
                 try:
                     await pool.release(connection)
                     
-                    async with self._lock:
-                        self.pool_stats["active_connections"] -= 1
-                        
+                    self.pool_stats["active_connections"] -= 1
+                    
                     logger.debug("connection_released")
                     
                 except Exception as e:
@@ -259,6 +410,30 @@ class ConnectionPoolOptimizer:
                         error=str(e)
                     )
     
+    async def warm(self, pool, n: int) -> None:
+        """
+        Pre-warm the pool by concurrently acquiring n connections and pinging them,
+        so the first requests after startup don't pay connection setup cost
+        
+        Args:
+            pool: Database connection pool
+            n: Number of connections to warm
+        """
+        async def ping():
+            async with self.get_optimized_connection(pool) as connection:
+                await connection.execute("SELECT 1")
+        
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(ping() for _ in range(n)), return_exceptions=True)
+        failed = sum(1 for result in results if isinstance(result, Exception))
+        
+        logger.info(
+            "connection_pool_warmed",
+            connections=n,
+            failed_connections=failed,
+            warmup_time=time.perf_counter() - start_time
+        )
+    
     async def get_pool_metrics(self, pool) -> Dict[str, Any]:
         """
         Get comprehensive pool performance metrics
@@ -269,25 +444,25 @@ class ConnectionPoolOptimizer:
         Returns:
             Dictionary with pool performance metrics
         """
-        async with self._lock:
-            avg_wait_time = (
-                self.pool_stats["connection_wait_time"] / 
-                max(1, self.pool_stats["total_connections"])
-            )
-            
-            return {
-                "pool_size": pool.get_size() if pool else 0,
-                "idle_connections": pool.get_idle_size() if pool else 0,
-                "max_size": pool.get_max_size() if pool else 0,
-                "total_connections_requested": self.pool_stats["total_connections"],
-                "active_connections": self.pool_stats["active_connections"],
-                "failed_connections": self.pool_stats["failed_connections"],
-                "average_wait_time": avg_wait_time,
-                "success_rate": (
-                    (self.pool_stats["total_connections"] - self.pool_stats["failed_connections"]) /
-                    max(1, self.pool_stats["total_connections"])
-                ) * 100
-            }
+        stats = dict(self.pool_stats)
+        avg_wait_time = (
+            stats["connection_wait_time"] / 
+            max(1, stats["total_connections"])
+        )
+        
+        return {
+            "pool_size": pool.get_size() if pool else 0,
+            "idle_connections": pool.get_idle_size() if pool else 0,
+            "max_size": pool.get_max_size() if pool else 0,
+            "total_connections_requested": stats["total_connections"],
+            "active_connections": stats["active_connections"],
+            "failed_connections": stats["failed_connections"],
+            "average_wait_time": avg_wait_time,
+            "success_rate": (
+                (stats["total_connections"] - stats["failed_connections"]) /
+                max(1, stats["total_connections"])
+            ) * 100
+        }
 
 
 class BackgroundTaskProcessor:
@@ -297,7 +472,8 @@ class BackgroundTaskProcessor:
     
     def __init__(self, max_workers: int = 2):
         self.max_workers = max_workers
-        self.task_queue = asyncio.Queue()
+        # Bounded so a slow consumer pushes back on producers instead of growing memory
+        self.task_queue = asyncio.Queue(maxsize=max_workers * settings.BG_QUEUE_MULTIPLIER)
         self.workers = []
         self.running = False
         self.processed_tasks = 0
@@ -346,14 +522,26 @@ class BackgroundTaskProcessor:
             failed_tasks=self.failed_tasks
         )
     
-    async def submit_task(self, task_func: Callable, *args, **kwargs):
+    async def submit_task(
+        self,
+        task_func: Callable,
+        *args,
+        submit_timeout: Optional[float] = None,
+        **kwargs
+    ):
         """
         Submit a task for background processing
         
+        Waits for queue space when the queue is full.
+        
         Args:
             task_func: Async function to execute
             *args: Positional arguments for the function
+            submit_timeout: Maximum seconds to wait for queue space (None waits indefinitely)
             **kwargs: Keyword arguments for the function
+            
+        Raises:
+            asyncio.TimeoutError: If the queue stays full for submit_timeout seconds
         """
         if not self.running:
             await self.start()
@@ -362,10 +550,20 @@ class BackgroundTaskProcessor:
             "func": task_func,
             "args": args,
             "kwargs": kwargs,
-            "submitted_at": time.time()
+            "submitted_at": time.time(),  # Wall clock, for audit logging
+            "enqueued_at": time.perf_counter()  # Monotonic, for wait time
         }
         
-        await self.task_queue.put(task_data)
+        try:
+            await asyncio.wait_for(self.task_queue.put(task_data), timeout=submit_timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                "background_task_rejected",
+                function_name=task_func.__name__,
+                queue_size=self.task_queue.qsize(),
+                submit_timeout=submit_timeout
+            )
+            raise
         
         logger.debug(
             "background_task_submitted",
@@ -384,14 +582,11 @@ class BackgroundTaskProcessor:
         
         while self.running:
             try:
-                # Wait for task with timeout
-                task_data = await asyncio.wait_for(
-                    self.task_queue.get(),
-                    timeout=1.0
-                )
+                # Sleep until a task arrives; stop() cancels the wait
+                task_data = await self.task_queue.get()
                 
-                start_time = time.time()
-                wait_time = start_time - task_data["submitted_at"]
+                start_time = time.perf_counter()
+                wait_time = start_time - task_data["enqueued_at"]
                 
                 logger.debug(
                     "background_task_processing",
@@ -404,7 +599,7 @@ class BackgroundTaskProcessor:
                 try:
                     await task_data["func"](*task_data["args"], **task_data["kwargs"])
                     
-                    processing_time = time.time() - start_time
+                    processing_time = time.perf_counter() - start_time
                     self.processed_tasks += 1
                     
                     logger.info(
@@ -428,10 +623,6 @@ class BackgroundTaskProcessor:
                 # Mark task as done
                 self.task_queue.task_done()
                 
-            except asyncio.TimeoutError:
-                # No tasks available, continue waiting
-                continue
-                
             except asyncio.CancelledError:
                 logger.info("background_worker_cancelled", worker_name=worker_name)
                 break
@@ -452,6 +643,8 @@ class BackgroundTaskProcessor:
             "running": self.running,
             "workers": len(self.workers),
             "queue_size": self.task_queue.qsize(),
+            "queue_capacity": self.task_queue.maxsize,
+            "queue_fullness": self.task_queue.qsize() / self.task_queue.maxsize,
             "processed_tasks": self.processed_tasks,
             "failed_tasks": self.failed_tasks,
             "success_rate": (
@@ -472,11 +665,11 @@ def async_timer(func):
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             logger.debug(
                 "async_function_completed",
@@ -487,7 +680,7 @@ def async_timer(func):
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             logger.error(
                 "async_function_failed",
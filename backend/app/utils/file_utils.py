@@ -1,9 +1,11 @@
 """
 File processing utilities for secure file handling
 """
+import asyncio
+import hashlib
 import os
 import tempfile
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, FrozenSet, Optional
 from fastapi import UploadFile
 
 from app.utils.logger import get_logger
@@ -13,6 +15,14 @@ from app.config import settings
 
 logger = get_logger(__name__)
 
+# Uploads are copied in fixed-size chunks so memory per request stays bounded
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Settings may yield a list; freeze it once for constant-time membership checks
+_ALLOWED_TYPES: FrozenSet[str] = frozenset(settings.ALLOWED_FILE_TYPES)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 async def validate_upload_file(upload_file: UploadFile) -> Dict[str, Any]:
     """
@@ -22,7 +32,10 @@ async def validate_upload_file(upload_file: UploadFile) -> Dict[str, Any]:
         upload_file: FastAPI UploadFile object
         
     Returns:
-        Dictionary with validation results and file metadata
+        Dictionary with validation results and file metadata. The upload
+        bytes are not kept in memory: they are spooled to ``content_path``
+        (owned by the caller, who must clean it up) and described by
+        ``file_size`` and ``content_sha256``.
         
     Raises:
         ValidationError: If file validation fails
@@ -32,27 +45,47 @@ async def validate_upload_file(upload_file: UploadFile) -> Dict[str, Any]:
     if not upload_file.filename:
         raise ValidationError("Filename is required")
     
-    # Read file content
-    content = await upload_file.read()
-    
-    # Reset file pointer for potential future reads
-    await upload_file.seek(0)
-    
     # Validate filename
     safe_filename = InputSanitizer.validate_filename(upload_file.filename)
+    _, ext = os.path.splitext(safe_filename)
+    
+    # Work on Starlette's underlying spooled file directly: measure it and
+    # sniff its header without reading the whole upload into memory
+    source = upload_file.file
+    source.seek(0, os.SEEK_END)
+    file_size = source.tell()
+    source.seek(0)
     
-    # Perform security validation
+    if file_size > settings.MAX_FILE_SIZE:
+        raise FileSizeError(file_size, settings.MAX_FILE_SIZE)
+    
+    # Perform security validation before anything is copied to disk
     validator = FileValidator()
-    validation_result = validator.validate_file_security(
-        file_content=content,
+    validation_result = await asyncio.to_thread(
+        validator.validate_file_security,
+        file_content=source,
         filename=safe_filename,
-        expected_mime_types=settings.ALLOWED_FILE_TYPES
+        expected_mime_types=_ALLOWED_TYPES
     )
     
+    # Copy the upload to a temporary file in one pass, hashing as we go
+    fd, content_path = tempfile.mkstemp(suffix=ext)
+    try:
+        content_sha256 = await asyncio.to_thread(_copy_and_hash, source, fd)
+    except BaseException:
+        try:
+            os.unlink(content_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        # Reset file pointer for potential future reads
+        source.seek(0)
+    
     logger.info(
         "file_validation_completed",
         filename=safe_filename,
-        file_size=validation_result["file_size"],
+        file_size=file_size,
         mime_type=validation_result["detected_mime_type"],
         security_passed=True
     )
@@ -60,12 +93,24 @@ async def validate_upload_file(upload_file: UploadFile) -> Dict[str, Any]:
     return {
         "original_filename": upload_file.filename,
         "safe_filename": safe_filename,
-        "content": content,
+        "content_path": content_path,
+        "content_sha256": content_sha256,
         "content_type": upload_file.content_type,
-        **validation_result
+        **validation_result,
+        "file_size": file_size
     }
 
 
+def _copy_and_hash(source: BinaryIO, fd: int) -> str:
+    """Copy a file object into an open descriptor, returning the SHA-256 hex digest"""
+    hasher = hashlib.sha256()
+    with os.fdopen(fd, "wb") as out:
+        while chunk := source.read(_UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+            out.write(chunk)
+    return hasher.hexdigest()
+
+
 def create_secure_temp_file(content: bytes, filename: str) -> str:
     """
     Create a secure temporary file with proper cleanup tracking
@@ -80,10 +125,16 @@ def create_secure_temp_file(content: bytes, filename: str) -> str:
     # Extract file extension for proper handling
     _, ext = os.path.splitext(filename)
     
-    # Create temporary file with proper extension
-    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
-        temp_file.write(content)
-        temp_path = temp_file.name
+    # mkstemp opens with O_EXCL and 0600; write through the raw fd in
+    # bounded slabs, looping on short writes
+    fd, temp_path = tempfile.mkstemp(suffix=ext)
+    try:
+        view = memoryview(content)
+        while view:
+            written = os.write(fd, view[:_UPLOAD_CHUNK_SIZE])
+            view = view[written:]
+    finally:
+        os.close(fd)
     
     logger.debug(
         "secure_temp_file_created",
@@ -123,7 +174,7 @@ def is_supported_file_type(mime_type: str) -> bool:
     Returns:
         True if supported, False otherwise
     """
-    return mime_type in settings.ALLOWED_FILE_TYPES
+    return mime_type in _ALLOWED_TYPES
 
 
 def get_max_file_size() -> int:
@@ -148,9 +199,7 @@ def format_file_size(size_bytes: int) -> str:
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
\ No newline at end of file
+    
+    # Each unit step is a factor of 2**10, so the magnitude falls out of bit_length
+    index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
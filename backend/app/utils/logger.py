@@ -2,43 +2,55 @@
 Structured JSON logging with contextual data
 """
 import logging
+import logging.handlers
+import queue
 import sys
+import time
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from datetime import datetime
-import json
 from contextvars import ContextVar
 
+import orjson
+
 from app.config import settings
 
 # Context variables for request tracking
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 user_id_var: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
 
+# Background listener that formats and writes records queued by the root logger
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Date/time prefix of the last formatted second, reused until it changes
+        self._cached_second = -1
+        self._cached_prefix = ""
+    
+    def _format_timestamp(self, created: float) -> str:
+        """Format record creation time as an ISO 8601 UTC timestamp"""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = second
+        return f"{self._cached_prefix}.{int((created - second) * 1e6):06d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON"""
         
         # Base log data
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
-        # Add context variables if available
-        request_id = request_id_var.get()
-        if request_id:
-            log_data["request_id"] = request_id
-            
-        user_id = user_id_var.get()
-        if user_id:
-            log_data["user_id"] = user_id
-        
-        # Add extra fields from the log record
+        # Add extra fields (including request context) from the log record
         if hasattr(record, 'extra_fields'):
             log_data.update(record.extra_fields)
         
@@ -46,7 +58,11 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data, default=str)
+        return orjson.dumps(
+            log_data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
 
 
 class ContextualLogger:
@@ -57,21 +73,32 @@ class ContextualLogger:
     
     def _log(self, level: int, message: str, **kwargs):
         """Internal logging method with context injection"""
-        extra_fields = kwargs.copy()
+        # Skip record creation entirely for disabled levels
+        if not self.logger.isEnabledFor(level):
+            return
         
-        # Create a log record with extra fields
-        record = self.logger.makeRecord(
-            name=self.logger.name,
-            level=level,
-            fn="",
-            lno=0,
-            msg=message,
-            args=(),
-            exc_info=None
-        )
-        record.extra_fields = extra_fields
+        # kwargs is already a fresh dict per call and is only read by the formatter
+        extra_fields = kwargs
+        
+        # Resolve request context once here rather than in the formatter;
+        # explicitly passed values take precedence
+        request_id = request_id_var.get()
+        if request_id:
+            extra_fields.setdefault("request_id", request_id)
+        
+        user_id = user_id_var.get()
+        if user_id:
+            extra_fields.setdefault("user_id", user_id)
         
-        self.logger.handle(record)
+        # Let the stdlib build the record; stacklevel skips this method and
+        # the level helper so funcName/lineno point at the real call site
+        self.logger._log(
+            level, message, (), extra={"extra_fields": extra_fields}, stacklevel=3
+        )
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Check the level up front so hot paths can skip building log kwargs"""
+        return self.logger.isEnabledFor(level)
     
     def debug(self, message: str, **kwargs):
         """Log debug message with context"""
@@ -94,8 +121,20 @@ class ContextualLogger:
         self._log(logging.CRITICAL, message, **kwargs)
 
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue is in-process, so the record need not be pickled; only
+        # freeze the message so later mutation of args cannot leak through
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logging():
     """Configure structured logging for the application"""
+    global _queue_listener
     
     # Get log level from settings
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
@@ -105,6 +144,7 @@ def setup_logging():
     root_logger.setLevel(log_level)
     
     # Remove existing handlers
+    shutdown_logging()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -120,15 +160,47 @@ def setup_logging():
         )
     
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    # Log calls only enqueue; formatting and stdout writes happen on the
+    # listener thread so they never block the event loop
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    root_logger.addHandler(queue_handler)
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Configure specific loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("fastapi").setLevel(logging.INFO)
 
 
+def shutdown_logging():
+    """Flush queued log records and write any later records synchronously"""
+    global _queue_listener
+    
+    if _queue_listener is None:
+        return
+    
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()
+    
+    # Swap the queue handler for the real handlers so records emitted after
+    # shutdown are still written
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, _DeferredQueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> ContextualLogger:
-    """Get a contextual logger instance"""
+    """Get a contextual logger instance (one shared wrapper per logger name)"""
     logger = logging.getLogger(name)
     return ContextualLogger(logger)
 
@@ -1,15 +1,21 @@
 """
 Comprehensive metrics collection and monitoring system
 """
+import logging
 import time
 import asyncio
-from typing import Dict, List, Any, Optional, Callable
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Any, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from contextlib import asynccontextmanager
 from enum import Enum
 
+import numpy as np
+
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,14 +29,135 @@ class MetricType(Enum):
     TIMER = "timer"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetricPoint:
     """Individual metric data point"""
     name: str
     value: float
-    timestamp: datetime
-    labels: Dict[str, str] = field(default_factory=dict)
+    timestamp: float  # Unix epoch seconds
+    labels: Tuple[Tuple[str, str], ...] = ()
     metric_type: MetricType = MetricType.GAUGE
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """Timestamp rendered as a naive UTC ISO 8601 string"""
+        return datetime.utcfromtimestamp(self.timestamp).isoformat()
+    
+    @property
+    def labels_dict(self) -> Dict[str, str]:
+        return dict(self.labels)
+
+
+@lru_cache(maxsize=1024)
+def _intern_labels(labels: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """Share one tuple object between points with identical labels"""
+    return labels
+
+
+@lru_cache(maxsize=1024)
+def _single_label(key: str, value: str) -> Tuple[Tuple[str, str], ...]:
+    """Shared label tuple for a single key/value pair, built once per pair"""
+    return ((key, value),)
+
+
+@lru_cache(maxsize=1024)
+def _api_call_labels(api_name: str, success: bool) -> Tuple[Tuple[str, str], ...]:
+    """Shared label tuple for external_api_calls_total, built once per (api, status)"""
+    return (("api", api_name), ("status", "success" if success else "error"))
+
+
+def _utc_timestamp(moment: datetime) -> float:
+    """Convert a datetime (naive values are taken as UTC) to epoch seconds"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _series_key(name: str, labels: Tuple[Tuple[str, str], ...]) -> str:
+    """Render a metric name and its labels as a single series key"""
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{key}={value}" for key, value in labels) + "}"
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimator using the P-square algorithm (Jain & Chlamtac)
+    
+    Keeps five markers regardless of how many samples are added, so each
+    update is O(1) and the current estimate is read in O(1).
+    """
+    
+    __slots__ = ("quantile", "heights", "positions", "desired", "increments")
+    
+    def __init__(self, quantile: float):
+        self.quantile = quantile
+        self.heights: List[float] = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self.increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+    
+    def add(self, value: float):
+        """Add a sample and adjust the markers"""
+        heights = self.heights
+        
+        # Collect the first five samples exactly
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+        
+        # Find the cell containing the sample, extending the extremes if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect_right(heights, value) - 1
+        
+        positions = self.positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+        
+        # Move the middle markers towards their desired positions
+        for i in (1, 2, 3):
+            delta = self.desired[i] - positions[i]
+            if ((delta >= 1 and positions[i + 1] - positions[i] > 1) or
+                    (delta <= -1 and positions[i - 1] - positions[i] < -1)):
+                step = 1 if delta > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+    
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+    
+    def _linear(self, i: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+    
+    @property
+    def value(self) -> float:
+        """Current quantile estimate (exact while fewer than five samples)"""
+        heights = self.heights
+        if not heights:
+            return 0.0
+        if len(heights) < 5:
+            return heights[min(int(len(heights) * self.quantile), len(heights) - 1)]
+        return heights[2]
+
+
+def _latency_estimators() -> Dict[float, P2Quantile]:
+    return {quantile: P2Quantile(quantile) for quantile in (0.5, 0.95, 0.99)}
 
 
 @dataclass
@@ -41,9 +168,7 @@ class PerformanceMetrics:
     total_latency: float = 0.0
     min_latency: float = float('inf')
     max_latency: float = 0.0
-    p50_latency: float = 0.0
-    p95_latency: float = 0.0
-    p99_latency: float = 0.0
+    latency_quantiles: Dict[float, P2Quantile] = field(default_factory=_latency_estimators)
     
     def add_latency(self, latency: float):
         """Add a latency measurement"""
@@ -51,6 +176,21 @@ class PerformanceMetrics:
         self.total_latency += latency
         self.min_latency = min(self.min_latency, latency)
         self.max_latency = max(self.max_latency, latency)
+        
+        for estimator in self.latency_quantiles.values():
+            estimator.add(latency)
+    
+    @property
+    def p50_latency(self) -> float:
+        return self.latency_quantiles[0.5].value
+    
+    @property
+    def p95_latency(self) -> float:
+        return self.latency_quantiles[0.95].value
+    
+    @property
+    def p99_latency(self) -> float:
+        return self.latency_quantiles[0.99].value
     
     def add_error(self):
         """Record an error"""
@@ -70,15 +210,28 @@ class PerformanceMetrics:
 class MetricsCollector:
     """
     Comprehensive metrics collection system for performance monitoring
+    
+    All writes happen on the event loop thread and never await mid-update,
+    so writers need no lock or per-writer sharding; background sweeps (see
+    SystemResourceMonitor) gather their values off-loop and hand them over
+    in one record_metrics call. Each uvicorn worker process keeps its own
+    collector.
     """
     
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
-        self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
+        # Counters only need their running total per label set; gauges,
+        # timers and histograms keep a bounded window of points
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], MetricPoint] = {}
+        self._history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
         self.performance_metrics: Dict[str, PerformanceMetrics] = defaultdict(PerformanceMetrics)
-        self.latency_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history))
         self.active_sessions: Dict[str, datetime] = {}
         self.session_count = 0
+        # Endpoints with new latency samples since the last alert check
+        self._dirty_endpoints: Set[str] = set()
+        # Serialises readers only. Writers never await between reading and
+        # updating shared state, so the event loop already serialises them and
+        # every recording path (including the helpers below) stays lock-free
         self._lock = asyncio.Lock()
     
     async def record_metric(
@@ -97,17 +250,11 @@ class MetricsCollector:
             metric_type: Type of metric
             labels: Optional labels for the metric
         """
-        async with self._lock:
-            metric_point = MetricPoint(
-                name=name,
-                value=value,
-                timestamp=datetime.utcnow(),
-                labels=labels or {},
-                metric_type=metric_type
-            )
-            
-            self.metrics[name].append(metric_point)
-            
+        self._record_fast(
+            name, value, metric_type, _intern_labels(tuple(labels.items())) if labels else ()
+        )
+        
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "metric_recorded",
                 metric_name=name,
@@ -116,6 +263,65 @@ class MetricsCollector:
                 labels=labels
             )
     
+    async def record_metrics(
+        self,
+        metrics: Dict[str, float],
+        metric_type: MetricType = MetricType.GAUGE,
+        timestamp: Optional[float] = None
+    ):
+        """
+        Record several unlabelled metric values in one call
+        
+        Args:
+            metrics: Mapping of metric name to value
+            metric_type: Type shared by all of the metrics
+            timestamp: When the values were sampled (defaults to now)
+        """
+        now = time.time() if timestamp is None else timestamp
+        for name, value in metrics.items():
+            self._record_fast(name, value, metric_type, timestamp=now)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "metrics_recorded",
+                metric_count=len(metrics),
+                metric_type=metric_type.value
+            )
+    
+    def _record_fast(
+        self,
+        name: str,
+        value: float,
+        metric_type: MetricType = MetricType.GAUGE,
+        labels: Tuple[Tuple[str, str], ...] = (),
+        timestamp: Optional[float] = None
+    ):
+        """
+        Append a metric point without awaiting
+        
+        Writers never take the lock: nothing here yields to the event loop,
+        so each append is atomic with respect to other coroutines. Callers
+        recording several points for one event pass a shared ``timestamp``.
+        ``labels`` must be a shared (interned) tuple, not a fresh dict.
+        Counter values are increments added to the series' running total.
+        """
+        if metric_type is MetricType.COUNTER:
+            key = (name, labels)
+            previous = self._counters.get(key)
+            if previous is not None:
+                value = previous.value + value
+        point = MetricPoint(
+            name=name,
+            value=value,
+            timestamp=time.time() if timestamp is None else timestamp,
+            labels=labels,
+            metric_type=metric_type
+        )
+        if metric_type is MetricType.COUNTER:
+            self._counters[key] = point
+        else:
+            self._history[name].append(point)
+    
     async def record_request_latency(self, endpoint: str, latency: float, success: bool = True):
         """
         Record request latency and update performance metrics
@@ -125,32 +331,48 @@ class MetricsCollector:
             latency: Request latency in seconds
             success: Whether the request was successful
         """
-        async with self._lock:
-            # Update performance metrics
-            perf_metrics = self.performance_metrics[endpoint]
-            perf_metrics.add_latency(latency)
-            
-            if not success:
-                perf_metrics.add_error()
-            
-            # Store latency for percentile calculations
-            self.latency_history[endpoint].append(latency)
-            
-            # Update percentiles
-            if len(self.latency_history[endpoint]) > 0:
-                sorted_latencies = sorted(self.latency_history[endpoint])
-                count = len(sorted_latencies)
-                
-                perf_metrics.p50_latency = sorted_latencies[int(count * 0.5)]
-                perf_metrics.p95_latency = sorted_latencies[int(count * 0.95)]
-                perf_metrics.p99_latency = sorted_latencies[int(count * 0.99)]
-            
-            # Record as metric points
-            await self.record_metric(f"{endpoint}_latency", latency, MetricType.TIMER)
-            await self.record_metric(f"{endpoint}_requests_total", perf_metrics.request_count, MetricType.COUNTER)
+        # Update performance metrics
+        perf_metrics = self.performance_metrics[endpoint]
+        perf_metrics.add_latency(latency)
+        self._dirty_endpoints.add(endpoint)
+        
+        if not success:
+            perf_metrics.add_error()
+        
+        # Record as metric points, all stamped with the same instant
+        now = time.time()
+        self._record_fast(f"{endpoint}_latency", latency, MetricType.TIMER, timestamp=now)
+        self._record_fast(
+            f"{endpoint}_requests_total", 1, MetricType.COUNTER, timestamp=now
+        )
+        
+        if not success:
+            self._record_fast(
+                f"{endpoint}_errors_total", 1, MetricType.COUNTER, timestamp=now
+            )
+    
+    def pop_dirty_endpoints(self) -> Set[str]:
+        """Return endpoints updated since the previous call and reset the set"""
+        dirty, self._dirty_endpoints = self._dirty_endpoints, set()
+        return dirty
+    
+    def get_perf_arrays(
+        self, endpoints: Optional[Iterable[str]] = None
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Pack per-endpoint error rates and P95 latencies into parallel arrays
+        
+        Args:
+            endpoints: Endpoints to include (defaults to all tracked endpoints)
             
-            if not success:
-                await self.record_metric(f"{endpoint}_errors_total", perf_metrics.error_count, MetricType.COUNTER)
+        Returns:
+            Tuple of (endpoints, error_rates, p95_latencies)
+        """
+        names = list(self.performance_metrics if endpoints is None else endpoints)
+        perf = [self.performance_metrics[name] for name in names]
+        error_rates = np.fromiter((m.error_rate for m in perf), dtype=np.float64, count=len(perf))
+        p95s = np.fromiter((m.p95_latency for m in perf), dtype=np.float64, count=len(perf))
+        return names, error_rates, p95s
     
     async def record_model_inference_time(self, model_name: str, inference_time: float):
         """
@@ -160,18 +382,19 @@ class MetricsCollector:
             model_name: Name of the ML model
             inference_time: Inference time in seconds
         """
-        await self.record_metric(
-            f"model_inference_time",
+        self._record_fast(
+            "model_inference_time",
             inference_time,
             MetricType.TIMER,
-            labels={"model": model_name}
+            labels=_single_label("model", model_name)
         )
         
-        logger.debug(
-            "model_inference_recorded",
-            model_name=model_name,
-            inference_time=inference_time
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "model_inference_recorded",
+                model_name=model_name,
+                inference_time=inference_time
+            )
     
     async def record_database_query_time(self, query_type: str, execution_time: float):
         """
@@ -181,18 +404,19 @@ class MetricsCollector:
             query_type: Type of database query (select, insert, update, delete)
             execution_time: Query execution time in seconds
         """
-        await self.record_metric(
-            f"database_query_time",
+        self._record_fast(
+            "database_query_time",
             execution_time,
             MetricType.TIMER,
-            labels={"query_type": query_type}
+            labels=_single_label("query_type", query_type)
         )
         
-        logger.debug(
-            "database_query_recorded",
-            query_type=query_type,
-            execution_time=execution_time
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "database_query_recorded",
+                query_type=query_type,
+                execution_time=execution_time
+            )
     
     async def record_external_api_call(self, api_name: str, response_time: float, success: bool):
         """
@@ -203,26 +427,30 @@ class MetricsCollector:
             response_time: API response time in seconds
             success: Whether the API call was successful
         """
-        await self.record_metric(
-            f"external_api_response_time",
+        now = time.time()
+        self._record_fast(
+            "external_api_response_time",
             response_time,
             MetricType.TIMER,
-            labels={"api": api_name}
+            labels=_single_label("api", api_name),
+            timestamp=now
         )
         
-        await self.record_metric(
-            f"external_api_calls_total",
+        self._record_fast(
+            "external_api_calls_total",
             1,
             MetricType.COUNTER,
-            labels={"api": api_name, "status": "success" if success else "error"}
+            labels=_api_call_labels(api_name, success),
+            timestamp=now
         )
         
-        logger.debug(
-            "external_api_call_recorded",
-            api_name=api_name,
-            response_time=response_time,
-            success=success
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "external_api_call_recorded",
+                api_name=api_name,
+                response_time=response_time,
+                success=success
+            )
     
     async def start_user_session(self, user_id: str):
         """
@@ -231,12 +459,12 @@ class MetricsCollector:
         Args:
             user_id: User identifier
         """
-        async with self._lock:
-            self.active_sessions[user_id] = datetime.utcnow()
-            self.session_count += 1
-            
-            await self.record_metric("active_sessions", len(self.active_sessions), MetricType.GAUGE)
-            await self.record_metric("total_sessions", self.session_count, MetricType.COUNTER)
+        self.active_sessions[user_id] = datetime.utcnow()
+        self.session_count += 1
+        
+        now = time.time()
+        self._record_fast("active_sessions", len(self.active_sessions), MetricType.GAUGE, timestamp=now)
+        self._record_fast("total_sessions", 1, MetricType.COUNTER, timestamp=now)
     
     async def end_user_session(self, user_id: str):
         """
@@ -245,13 +473,12 @@ class MetricsCollector:
         Args:
             user_id: User identifier
         """
-        async with self._lock:
-            if user_id in self.active_sessions:
-                session_start = self.active_sessions.pop(user_id)
-                session_duration = (datetime.utcnow() - session_start).total_seconds()
-                
-                await self.record_metric("session_duration", session_duration, MetricType.TIMER)
-                await self.record_metric("active_sessions", len(self.active_sessions), MetricType.GAUGE)
+        if user_id in self.active_sessions:
+            session_start = self.active_sessions.pop(user_id)
+            session_duration = (datetime.utcnow() - session_start).total_seconds()
+            
+            self._record_fast("session_duration", session_duration, MetricType.TIMER)
+            self._record_fast("active_sessions", len(self.active_sessions), MetricType.GAUGE)
     
     async def get_metrics_summary(self) -> Dict[str, Any]:
         """
@@ -286,13 +513,20 @@ class MetricsCollector:
                 }
             
             # Current metric values (latest values)
-            for metric_name, metric_points in self.metrics.items():
+            current_metrics = summary["current_metrics"]
+            for (metric_name, labels), latest_point in self._counters.items():
+                current_metrics[_series_key(metric_name, labels)] = {
+                    "value": latest_point.value,
+                    "timestamp": latest_point.timestamp_iso,
+                    "labels": latest_point.labels_dict
+                }
+            for metric_name, metric_points in self._history.items():
                 if metric_points:
                     latest_point = metric_points[-1]
-                    summary["current_metrics"][metric_name] = {
+                    current_metrics[metric_name] = {
                         "value": latest_point.value,
-                        "timestamp": latest_point.timestamp.isoformat(),
-                        "labels": latest_point.labels
+                        "timestamp": latest_point.timestamp_iso,
+                        "labels": latest_point.labels_dict
                     }
             
             return summary
@@ -312,15 +546,26 @@ class MetricsCollector:
             end_time: End of the time period
             
         Returns:
-            List of metric points within the time period
+            List of metric points within the time period. Counters only
+            retain their latest total for each label set.
         """
         async with self._lock:
-            if metric_name not in self.metrics:
-                return []
+            if metric_name in self._history:
+                points = self._history[metric_name]
+            else:
+                points = [
+                    point for (name, _), point in self._counters.items()
+                    if name == metric_name
+                ]
+                if not points:
+                    return []
+            
+            start_ts = _utc_timestamp(start_time)
+            end_ts = _utc_timestamp(end_time)
             
             return [
-                point for point in self.metrics[metric_name]
-                if start_time <= point.timestamp <= end_time
+                point for point in points
+                if start_ts <= point.timestamp <= end_ts
             ]
 
 
@@ -337,7 +582,8 @@ class PerformanceMonitor:
     
     async def __aenter__(self):
         self.start_time = time.time()
-        logger.debug("performance_monitoring_started", operation=self.operation_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("performance_monitoring_started", operation=self.operation_name)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -352,7 +598,7 @@ class PerformanceMonitor:
                     duration=duration,
                     error=str(exc_val)
                 )
-            else:
+            elif logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "performance_monitoring_completed",
                     operation=self.operation_name,
@@ -376,6 +622,8 @@ class AlertingSystem:
     Alerting system for performance degradation and system failures
     """
     
+    MAX_ALERT_HISTORY = 1000
+    
     def __init__(self, metrics_collector: MetricsCollector):
         self.metrics_collector = metrics_collector
         self.alert_thresholds = {
@@ -384,8 +632,11 @@ class AlertingSystem:
             "active_sessions": 100,  # 100 concurrent sessions
             "database_connection_failures": 10  # 10 failed connections
         }
-        self.alert_history: List[Dict[str, Any]] = []
-        self.alert_cooldown = {}  # Prevent alert spam
+        # Oldest first; bounded so a burst of alerts cannot grow it without limit
+        self.alert_history: deque = deque(maxlen=self.MAX_ALERT_HISTORY)
+        # Epoch seconds of each alert_history entry, parsed once on insert
+        self._alert_times: deque = deque(maxlen=self.MAX_ALERT_HISTORY)
+        self.alert_cooldown: Dict[str, float] = {}  # time.monotonic() of last alert per key
         self.cooldown_period = 300  # 5 minutes cooldown
     
     async def check_alerts(self) -> List[Dict[str, Any]]:
@@ -395,73 +646,80 @@ class AlertingSystem:
         Returns:
             List of active alerts
         """
-        current_time = datetime.utcnow()
+        current_ts = time.time()
+        current_time = datetime.utcfromtimestamp(current_ts)
+        now = time.monotonic()
         active_alerts = []
         
-        metrics_summary = await self.metrics_collector.get_metrics_summary()
+        collector = self.metrics_collector
+        
+        # Only endpoints with new samples since the last check can have changed;
+        # compare them against the thresholds in one pass and only build alerts
+        # for the breaches
+        endpoints, error_rates, p95s = collector.get_perf_arrays(collector.pop_dirty_endpoints())
+        error_threshold = self.alert_thresholds["error_rate"]
+        p95_threshold = self.alert_thresholds["response_time_p95"]
         
-        # Check error rate alerts
-        for endpoint, perf_metrics in metrics_summary["performance_metrics"].items():
-            error_rate = perf_metrics["error_rate"]
+        for i in np.nonzero(error_rates > error_threshold)[0]:
+            endpoint = endpoints[i]
+            error_rate = float(error_rates[i])
+            alert_key = f"error_rate_{endpoint}"
             
-            if error_rate > self.alert_thresholds["error_rate"]:
-                alert_key = f"error_rate_{endpoint}"
+            if self._should_send_alert(alert_key, now):
+                alert = {
+                    "type": "error_rate",
+                    "severity": "high" if error_rate > 10 else "medium",
+                    "message": f"High error rate on {endpoint}: {error_rate:.2f}%",
+                    "endpoint": endpoint,
+                    "current_value": error_rate,
+                    "threshold": error_threshold,
+                    "timestamp": current_time.isoformat()
+                }
                 
-                if self._should_send_alert(alert_key, current_time):
-                    alert = {
-                        "type": "error_rate",
-                        "severity": "high" if error_rate > 10 else "medium",
-                        "message": f"High error rate on {endpoint}: {error_rate:.2f}%",
-                        "endpoint": endpoint,
-                        "current_value": error_rate,
-                        "threshold": self.alert_thresholds["error_rate"],
-                        "timestamp": current_time.isoformat()
-                    }
-                    
-                    active_alerts.append(alert)
-                    self.alert_cooldown[alert_key] = current_time
-                    
-                    logger.warning(
-                        "alert_triggered",
-                        alert_type="error_rate",
-                        endpoint=endpoint,
-                        error_rate=error_rate
-                    )
-            
-            # Check response time alerts
-            p95_latency = perf_metrics["p95_latency"]
+                active_alerts.append(alert)
+                self.alert_cooldown[alert_key] = now
+                
+                logger.warning(
+                    "alert_triggered",
+                    alert_type="error_rate",
+                    endpoint=endpoint,
+                    error_rate=error_rate
+                )
+        
+        # Check response time alerts
+        for i in np.nonzero(p95s > p95_threshold)[0]:
+            endpoint = endpoints[i]
+            p95_latency = float(p95s[i])
+            alert_key = f"response_time_{endpoint}"
             
-            if p95_latency > self.alert_thresholds["response_time_p95"]:
-                alert_key = f"response_time_{endpoint}"
+            if self._should_send_alert(alert_key, now):
+                alert = {
+                    "type": "response_time",
+                    "severity": "high" if p95_latency > 60 else "medium",
+                    "message": f"High response time on {endpoint}: {p95_latency:.2f}s",
+                    "endpoint": endpoint,
+                    "current_value": p95_latency,
+                    "threshold": p95_threshold,
+                    "timestamp": current_time.isoformat()
+                }
                 
-                if self._should_send_alert(alert_key, current_time):
-                    alert = {
-                        "type": "response_time",
-                        "severity": "high" if p95_latency > 60 else "medium",
-                        "message": f"High response time on {endpoint}: {p95_latency:.2f}s",
-                        "endpoint": endpoint,
-                        "current_value": p95_latency,
-                        "threshold": self.alert_thresholds["response_time_p95"],
-                        "timestamp": current_time.isoformat()
-                    }
-                    
-                    active_alerts.append(alert)
-                    self.alert_cooldown[alert_key] = current_time
-                    
-                    logger.warning(
-                        "alert_triggered",
-                        alert_type="response_time",
-                        endpoint=endpoint,
-                        p95_latency=p95_latency
-                    )
+                active_alerts.append(alert)
+                self.alert_cooldown[alert_key] = now
+                
+                logger.warning(
+                    "alert_triggered",
+                    alert_type="response_time",
+                    endpoint=endpoint,
+                    p95_latency=p95_latency
+                )
         
         # Check session count alerts
-        active_sessions = metrics_summary["session_metrics"]["active_sessions"]
+        active_sessions = len(collector.active_sessions)
         
         if active_sessions > self.alert_thresholds["active_sessions"]:
             alert_key = "active_sessions"
             
-            if self._should_send_alert(alert_key, current_time):
+            if self._should_send_alert(alert_key, now):
                 alert = {
                     "type": "active_sessions",
                     "severity": "medium",
@@ -472,7 +730,7 @@ class AlertingSystem:
                 }
                 
                 active_alerts.append(alert)
-                self.alert_cooldown[alert_key] = current_time
+                self.alert_cooldown[alert_key] = now
                 
                 logger.warning(
                     "alert_triggered",
@@ -482,34 +740,29 @@ class AlertingSystem:
         
         # Store alerts in history
         self.alert_history.extend(active_alerts)
+        self._alert_times.extend([current_ts] * len(active_alerts))
         
-        # Keep only recent alerts (last 24 hours)
-        cutoff_time = current_time - timedelta(hours=24)
-        self.alert_history = [
-            alert for alert in self.alert_history
-            if datetime.fromisoformat(alert["timestamp"]) > cutoff_time
-        ]
+        # Keep only recent alerts (last 24 hours); history is in time order,
+        # so expired alerts are always at the front
+        cutoff_ts = current_ts - timedelta(hours=24).total_seconds()
+        while self._alert_times and self._alert_times[0] <= cutoff_ts:
+            self._alert_times.popleft()
+            self.alert_history.popleft()
         
         return active_alerts
     
-    def _should_send_alert(self, alert_key: str, current_time: datetime) -> bool:
+    def _should_send_alert(self, alert_key: str, now: float) -> bool:
         """
         Check if an alert should be sent based on cooldown period
         
         Args:
             alert_key: Unique key for the alert
-            current_time: Current timestamp
+            now: Current time.monotonic() value
             
         Returns:
             True if alert should be sent, False if in cooldown
         """
-        if alert_key not in self.alert_cooldown:
-            return True
-        
-        last_alert_time = self.alert_cooldown[alert_key]
-        time_since_last_alert = (current_time - last_alert_time).total_seconds()
-        
-        return time_since_last_alert > self.cooldown_period
+        return now - self.alert_cooldown.get(alert_key, float('-inf')) > self.cooldown_period
     
     def get_alert_history(self, hours: int = 24) -> List[Dict[str, Any]]:
         """
@@ -521,12 +774,11 @@ class AlertingSystem:
         Returns:
             List of alerts from the specified time period
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_ts = time.time() - timedelta(hours=hours).total_seconds()
         
-        return [
-            alert for alert in self.alert_history
-            if datetime.fromisoformat(alert["timestamp"]) > cutoff_time
-        ]
+        # Timestamps are in insertion order, so the cutoff is a binary search
+        start = bisect_right(self._alert_times, cutoff_ts)
+        return list(islice(self.alert_history, start, None))
 
 
 # Global instances
@@ -546,18 +798,33 @@ def monitor_performance(operation_name: str):
     """
     def decorator(func):
         if asyncio.iscoroutinefunction(func):
+            # Timed inline rather than through PerformanceMonitor so each call
+            # avoids a monitor object and its __aenter__/__aexit__ awaits
             async def async_wrapper(*args, **kwargs):
-                async with PerformanceMonitor(metrics_collector, operation_name) as monitor:
-                    try:
-                        return await func(*args, **kwargs)
-                    except Exception as e:
-                        monitor.mark_error()
-                        raise
+                start_time = time.perf_counter()
+                success = True
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    success = False
+                    logger.error(
+                        "performance_monitoring_error",
+                        operation=operation_name,
+                        duration=time.perf_counter() - start_time,
+                        error=str(e)
+                    )
+                    raise
+                finally:
+                    await metrics_collector.record_request_latency(
+                        operation_name,
+                        time.perf_counter() - start_time,
+                        success
+                    )
             return async_wrapper
         else:
             def sync_wrapper(*args, **kwargs):
                 # For sync functions, we'll need to handle differently
-                start_time = time.time()
+                start_time = time.perf_counter()
                 success = True
                 
                 try:
@@ -567,15 +834,16 @@ def monitor_performance(operation_name: str):
                     success = False
                     raise
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     # Note: This won't work for sync functions with async metrics
                     # In practice, all our functions should be async
-                    logger.debug(
-                        "sync_performance_monitoring",
-                        operation=operation_name,
-                        duration=duration,
-                        success=success
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "sync_performance_monitoring",
+                            operation=operation_name,
+                            duration=duration,
+                            success=success
+                        )
             
             return sync_wrapper
     
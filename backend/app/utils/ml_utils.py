@@ -3,15 +3,55 @@ ML model loading and caching utilities for NLU system
 """
 import asyncio
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
 from sentence_transformers import SentenceTransformer
 import torch
+from app.config import settings
 from app.utils.logger import get_logger
 from app.core.exceptions import NLUProcessingError
 
+# ONNX Runtime export of the NER model is optional
+try:
+    from optimum.onnxruntime import ORTModelForTokenClassification
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Representative input used to warm up inference kernels after loading
+_WARMUP_TEXT = (
+    "John Doe is a software engineer at Google with 10 years of experience "
+    "in Python and machine learning."
+)
+
+
+def quantize_linear_layers(model: Any, model_label: str) -> Any:
+    """
+    Apply dynamic int8 quantization to a model's linear layers.
+    Falls back to the original FP32 model if quantization is unsupported.
+    """
+    try:
+        quantized = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        logger.info("Model quantized to int8", model=model_label)
+        return quantized
+    except Exception as e:
+        logger.warning("Model quantization failed, using FP32 weights", model=model_label, error=str(e))
+        return model
+
+
+def quantize_sentence_transformer(model: SentenceTransformer) -> SentenceTransformer:
+    """Quantize the transformer module wrapped by a SentenceTransformer in place"""
+    try:
+        transformer = model[0]
+        transformer.auto_model = quantize_linear_layers(transformer.auto_model, "sentence_transformer")
+    except Exception as e:
+        logger.warning("Sentence transformer quantization skipped", error=str(e))
+    return model
+
 
 class ModelCache:
     """
@@ -23,20 +63,20 @@ class ModelCache:
     _lock = threading.Lock()
     
     def __new__(cls) -> 'ModelCache':
-        if cls._instance is None:
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-    
-    def __init__(self):
-        if not getattr(self, '_initialized', False):
-            self._models: Dict[str, Any] = {}
-            self._tokenizers: Dict[str, Any] = {}
-            self._pipelines: Dict[str, Any] = {}
-            self._model_health: Dict[str, bool] = {}
-            self._initialized = True
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._models: Dict[str, Any] = {}
+                    instance._tokenizers: Dict[str, Any] = {}
+                    instance._pipelines: Dict[str, Any] = {}
+                    instance._model_health: Dict[str, bool] = {}
+                    # Publish only once fully initialised; no __init__ is
+                    # defined, so later ModelCache() calls do no extra work
+                    cls._instance = instance
+        return instance
     
     async def load_models_at_startup(self) -> None:
         """
@@ -46,11 +86,16 @@ class ModelCache:
         logger.info("Starting ML model loading process")
         
         try:
-            # Load NER model and tokenizer
-            await self._load_ner_model()
-            
-            # Load sentence transformer model
-            await self._load_sentence_transformer()
+            # The models are independent, so load them on separate threads
+            # concurrently; wait for both so each records its health status
+            results = await asyncio.gather(
+                self._load_ner_model(),
+                self._load_sentence_transformer(),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
             
             logger.info("All ML models loaded successfully", 
                        models_loaded=list(self._models.keys()))
@@ -65,32 +110,9 @@ class ModelCache:
             model_name = "yashpwr/resume-ner-bert-v2"
             logger.info("Loading NER model", model_name=model_name)
             
-            # Run model loading in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            
-            # Load tokenizer
-            tokenizer = await loop.run_in_executor(
-                None, 
-                AutoTokenizer.from_pretrained, 
-                model_name
-            )
-            
-            # Load model
-            model = await loop.run_in_executor(
-                None,
-                AutoModelForTokenClassification.from_pretrained,
-                model_name
-            )
-            
-            # Create pipeline
-            ner_pipeline = await loop.run_in_executor(
-                None,
-                pipeline,
-                "ner",
-                model=model,
-                tokenizer=tokenizer,
-                aggregation_strategy="simple",
-                device=-1  # Use CPU for better compatibility
+            # Tokenizer, weights and pipeline load in one worker thread
+            tokenizer, model, ner_pipeline = await asyncio.to_thread(
+                self._load_ner_sync, model_name
             )
             
             self._models["ner_model"] = model
@@ -100,11 +122,64 @@ class ModelCache:
             
             logger.info("NER model loaded successfully")
             
+            await self._warm_up("ner", ner_pipeline, _WARMUP_TEXT)
+            
         except Exception as e:
             logger.error("Failed to load NER model", error=str(e))
             self._model_health["ner"] = False
             raise
     
+    def _load_ner_sync(self, model_name: str) -> Tuple[Any, Any, Any]:
+        """Blocking load of the NER tokenizer, model and pipeline"""
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        
+        model = self._load_ner_onnx(model_name) if settings.NER_USE_ONNX else None
+        if model is None:
+            model = AutoModelForTokenClassification.from_pretrained(model_name)
+            
+            # Quantize linear layers to int8 for faster CPU inference
+            if settings.NER_QUANTIZE:
+                model = quantize_linear_layers(model, "ner")
+        
+        ner_pipeline = pipeline(
+            "ner",
+            model=model,
+            tokenizer=tokenizer,
+            aggregation_strategy="simple",
+            device=-1  # Use CPU for better compatibility
+        )
+        return tokenizer, model, ner_pipeline
+    
+    @staticmethod
+    def _load_ner_onnx(model_name: str) -> Optional[Any]:
+        """
+        Load the NER model as an ONNX Runtime session on the CPU provider.
+        The export happens once and is cached on disk for later starts.
+        Returns None so the caller falls back to PyTorch if unavailable.
+        """
+        if not ONNX_AVAILABLE:
+            logger.warning("ONNX NER requested but optimum[onnxruntime] is not installed")
+            return None
+        
+        from app.utils.model_paths import TRANSFORMERS_CACHE_DIR
+        export_dir = TRANSFORMERS_CACHE_DIR / "onnx" / model_name.replace("/", "__")
+        
+        try:
+            if (export_dir / "model.onnx").exists():
+                return ORTModelForTokenClassification.from_pretrained(
+                    export_dir, provider="CPUExecutionProvider"
+                )
+            
+            model = ORTModelForTokenClassification.from_pretrained(
+                model_name, export=True, provider="CPUExecutionProvider"
+            )
+            model.save_pretrained(export_dir)
+            logger.info("NER model exported to ONNX", export_dir=str(export_dir))
+            return model
+        except Exception as e:
+            logger.warning("ONNX NER load failed, using PyTorch model", error=str(e))
+            return None
+    
     async def _load_sentence_transformer(self) -> None:
         """Load the sentence transformer model for semantic analysis"""
         try:
@@ -112,24 +187,38 @@ class ModelCache:
             logger.info("Loading sentence transformer model", model_name=model_name)
             
             # Run model loading in thread pool
-            loop = asyncio.get_event_loop()
+            sentence_model = await asyncio.to_thread(SentenceTransformer, model_name, device="cpu")
             
-            sentence_model = await loop.run_in_executor(
-                None,
-                SentenceTransformer,
-                model_name
-            )
+            if settings.EMBEDDING_QUANTIZE:
+                sentence_model = await asyncio.to_thread(quantize_sentence_transformer, sentence_model)
             
             self._models["sentence_transformer"] = sentence_model
             self._model_health["sentence_transformer"] = True
             
             logger.info("Sentence transformer model loaded successfully")
             
+            # A full batch so the batched GEMM paths are exercised too
+            await self._warm_up(
+                "sentence_transformer", sentence_model.encode, [_WARMUP_TEXT] * 8, batch_size=8
+            )
+            
         except Exception as e:
             logger.error("Failed to load sentence transformer model", error=str(e))
             self._model_health["sentence_transformer"] = False
             raise
     
+    @staticmethod
+    async def _warm_up(model_label: str, func: Any, *args: Any, **kwargs: Any) -> None:
+        """
+        Run one throwaway inference so one-off allocation and kernel setup
+        happen at startup instead of on the first user request.
+        """
+        try:
+            await asyncio.to_thread(func, *args, **kwargs)
+            logger.info("Model warm-up completed", model=model_label)
+        except Exception as e:
+            logger.warning("Model warm-up failed", model=model_label, error=str(e))
+    
     def get_ner_pipeline(self) -> Optional[Any]:
         """Get the NER pipeline for entity extraction"""
         if not self._model_health.get("ner", False):
@@ -169,9 +258,12 @@ class ModelCache:
         try:
             sentence_model = self.get_sentence_transformer()
             if sentence_model is not None:
-                # Test with simple text
-                test_embedding = sentence_model.encode("test text")
-                health_status["sentence_transformer"] = len(test_embedding) > 0
+                # Test with simple text; keep the output as a tensor and skip
+                # the progress bar, only the inference path matters here
+                test_embedding = sentence_model.encode(
+                    "test text", convert_to_tensor=True, show_progress_bar=False
+                )
+                health_status["sentence_transformer"] = test_embedding.shape[0] > 0
             else:
                 health_status["sentence_transformer"] = False
         except Exception as e:
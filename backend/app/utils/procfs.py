@@ -0,0 +1,84 @@
+"""
+Direct /proc readers for the system monitor's collection path (Linux only)
+
+Each reader opens its file once, reads it in one go and splits it, which
+skips psutil's generic per-attribute dispatch. Callers must check
+``PROCFS_AVAILABLE`` and fall back to psutil elsewhere.
+"""
+import os
+import sys
+from typing import Dict, Tuple
+
+PROCFS_AVAILABLE = sys.platform.startswith("linux") and os.path.isdir("/proc")
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_cpu_times() -> Tuple[int, int]:
+    """
+    Read the aggregate CPU line of /proc/stat
+
+    Returns:
+        Tuple of (busy_jiffies, total_jiffies)
+    """
+    with open("/proc/stat", "rb") as f:
+        fields = f.readline().split()
+    # user nice system idle iowait irq softirq steal; guest time is
+    # already included in user/nice
+    values = [int(value) for value in fields[1:9]]
+    total = sum(values)
+    idle = values[3] + values[4]
+    return total - idle, total
+
+
+def read_meminfo() -> Dict[str, int]:
+    """
+    Read /proc/meminfo
+
+    Returns:
+        Mapping of field name to value in bytes
+    """
+    info = {}
+    for line in _read("/proc/meminfo").splitlines():
+        name, value, *unit = line.split()
+        info[name[:-1].decode()] = int(value) * 1024 if unit else int(value)
+    return info
+
+
+def read_netdev() -> Tuple[int, int, int, int]:
+    """
+    Read /proc/net/dev, summed over all interfaces
+
+    Returns:
+        Tuple of (bytes_sent, bytes_recv, packets_sent, packets_recv)
+    """
+    bytes_sent = bytes_recv = packets_sent = packets_recv = 0
+    # The first two lines are column headers
+    for line in _read("/proc/net/dev").splitlines()[2:]:
+        fields = line.split(b":", 1)[1].split()
+        bytes_recv += int(fields[0])
+        packets_recv += int(fields[1])
+        bytes_sent += int(fields[8])
+        packets_sent += int(fields[9])
+    return bytes_sent, bytes_recv, packets_sent, packets_recv
+
+
+def read_self_status() -> Dict[str, int]:
+    """
+    Read the memory and thread counts of the current process
+
+    Returns:
+        Dictionary with ``rss`` and ``vms`` in bytes and ``num_threads``
+    """
+    status = {}
+    for line in _read("/proc/self/status").splitlines():
+        if line.startswith(b"VmRSS:"):
+            status["rss"] = int(line.split()[1]) * 1024
+        elif line.startswith(b"VmSize:"):
+            status["vms"] = int(line.split()[1]) * 1024
+        elif line.startswith(b"Threads:"):
+            status["num_threads"] = int(line.split()[1])
+    return status
@@ -2,15 +2,131 @@
 System resource monitoring utilities
 """
 import asyncio
+import os
+import threading
+import time
 import psutil
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from app.utils import procfs
 from app.utils.logger import get_logger
 from app.utils.metrics import metrics_collector
 
 logger = get_logger(__name__)
 
+# psutil's non-blocking CPU percentages are deltas since the previous read;
+# reads closer together than this are too noisy, so the last sample is reused
+_MIN_CPU_SAMPLE_INTERVAL = 0.1
+
+# Status requests within this many seconds share one psutil sweep
+_STATUS_TTL = 1.0
+
+# (limit file, usage file) for cgroup v2 and v1 memory controllers
+_CGROUP_MEMORY_FILES = (
+    ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+    ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+)
+
+
+def _read_int(path: str) -> Optional[int]:
+    """Read an integer from a cgroup file, or None if absent or unlimited"""
+    try:
+        with open(path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        # Missing file, or v2's literal "max" for no limit
+        return None
+
+
+@lru_cache(maxsize=1)
+def _cgroup_memory_files() -> Optional[Tuple[int, str]]:
+    """
+    Detect the container memory limit once
+    
+    Returns:
+        Tuple of (limit_bytes, usage_file), or None when not running under
+        a memory-limited cgroup
+    """
+    host_total = psutil.virtual_memory().total
+    for limit_file, usage_file in _CGROUP_MEMORY_FILES:
+        limit = _read_int(limit_file)
+        # cgroup v1 reports "no limit" as a huge sentinel value
+        if limit is not None and 0 < limit < host_total:
+            return limit, usage_file
+    return None
+
+
+def _cgroup_limit_bytes() -> Optional[int]:
+    """Container memory limit in bytes, or None if unlimited/not containerized"""
+    files = _cgroup_memory_files()
+    return files[0] if files else None
+
+
+def _cgroup_used_bytes() -> Optional[int]:
+    """Current container memory usage in bytes, or None if unavailable"""
+    files = _cgroup_memory_files()
+    return _read_int(files[1]) if files else None
+
+
+def _memory_usage() -> Tuple[int, int, int, float]:
+    """
+    Memory usage scoped to the container when it has a cgroup limit
+    
+    Returns:
+        Tuple of (total, used, available, percent)
+    """
+    limit = _cgroup_limit_bytes()
+    if limit is not None:
+        used = _cgroup_used_bytes()
+        if used is not None:
+            return limit, used, max(limit - used, 0), (used / limit) * 100
+    
+    if procfs.PROCFS_AVAILABLE:
+        # Same derivation as psutil.virtual_memory() on Linux
+        info = procfs.read_meminfo()
+        total = info["MemTotal"]
+        available = info.get("MemAvailable", info["MemFree"])
+        used = total - info["MemFree"] - info.get("Buffers", 0) - info.get("Cached", 0) - info.get("SReclaimable", 0)
+        if used < 0:
+            used = total - info["MemFree"]
+        return total, used, available, round((total - available) / total * 100, 1)
+    
+    memory = psutil.virtual_memory()
+    return memory.total, memory.used, memory.available, memory.percent
+
+
+def _network_counters() -> Tuple[int, int, int, int]:
+    """
+    System-wide network counters
+    
+    Returns:
+        Tuple of (bytes_sent, bytes_recv, packets_sent, packets_recv)
+    """
+    if procfs.PROCFS_AVAILABLE:
+        return procfs.read_netdev()
+    
+    network = psutil.net_io_counters()
+    return network.bytes_sent, network.bytes_recv, network.packets_sent, network.packets_recv
+
+
+def _swap_usage() -> Tuple[int, int, float]:
+    """
+    Swap usage
+    
+    Returns:
+        Tuple of (total, used, percent)
+    """
+    if procfs.PROCFS_AVAILABLE:
+        info = procfs.read_meminfo()
+        total = info.get("SwapTotal", 0)
+        used = total - info.get("SwapFree", 0)
+        return total, used, (used / total) * 100 if total else 0.0
+    
+    swap = psutil.swap_memory()
+    return swap.total, swap.used, swap.percent
+
 
 class SystemResourceMonitor:
     """
@@ -21,6 +137,41 @@ class SystemResourceMonitor:
         self.collection_interval = collection_interval
         self.monitoring_task = None
         self.running = False
+        # One handle for the lifetime of the monitor; static facts read once
+        self._process = psutil.Process()
+        self._cpu_count = psutil.cpu_count()
+        self._pid = self._process.pid
+        self._create_time = self._process.create_time()
+        # The root filesystem's size does not change at runtime; only the
+        # used/free block counts need reading each cycle
+        self._disk_total = psutil.disk_usage('/').total
+        
+        # Probe optional sensors once; on platforms where they are missing
+        # they would otherwise fail on every sweep
+        self._has_fds = self._probe(self._process.num_fds) if hasattr(self._process, "num_fds") else False
+        self._has_net = self._probe(_network_counters)
+        
+        # Prime the CPU counters so later reads return the usage since the
+        # previous read instead of blocking to sample
+        if procfs.PROCFS_AVAILABLE:
+            self._prev_cpu_times = procfs.read_cpu_times()
+        else:
+            psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+        self._cpu_sample: Tuple[float, float] = (0.0, 0.0)
+        self._cpu_sample_ts = time.monotonic()
+        # Sweeps run in worker threads; the periodic collection and a status
+        # request may sample the CPU counters at the same time
+        self._cpu_sample_lock = threading.Lock()
+        
+        # Last successful get_current_system_status payload and when it was built
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_ts = 0.0
+        self._status_lock = asyncio.Lock()
+        
+        # Status timestamps have one-second resolution; format each second once
+        self._ts_sec = 0
+        self._ts_str = ""
     
     async def start_monitoring(self):
         """Start continuous system resource monitoring"""
@@ -52,11 +203,19 @@ class SystemResourceMonitor:
         logger.info("system_monitoring_stopped")
     
     async def _monitoring_loop(self):
-        """Main monitoring loop that collects system metrics"""
+        """
+        Main monitoring loop that collects system metrics
+        
+        Collections are scheduled against absolute deadlines so the period
+        does not stretch by the time each collection takes.
+        """
+        loop = asyncio.get_running_loop()
+        interval = self.collection_interval
+        next_deadline = loop.time()
+        
         while self.running:
             try:
                 await self._collect_system_metrics()
-                await asyncio.sleep(self.collection_interval)
                 
             except asyncio.CancelledError:
                 break
@@ -66,63 +225,171 @@ class SystemResourceMonitor:
                     "system_monitoring_error",
                     error=str(e)
                 )
-                await asyncio.sleep(self.collection_interval)
-    
-    async def _collect_system_metrics(self):
-        """Collect and record system resource metrics"""
-        try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
             
-            await metrics_collector.record_metric("system_cpu_percent", cpu_percent)
-            await metrics_collector.record_metric("system_cpu_count", cpu_count)
-            
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            await metrics_collector.record_metric("system_memory_total", memory.total)
-            await metrics_collector.record_metric("system_memory_used", memory.used)
-            await metrics_collector.record_metric("system_memory_percent", memory.percent)
-            await metrics_collector.record_metric("system_memory_available", memory.available)
-            
-            # Disk metrics
-            disk = psutil.disk_usage('/')
-            await metrics_collector.record_metric("system_disk_total", disk.total)
-            await metrics_collector.record_metric("system_disk_used", disk.used)
-            await metrics_collector.record_metric("system_disk_percent", (disk.used / disk.total) * 100)
+            next_deadline += interval
+            now = loop.time()
+            if now >= next_deadline:
+                # Fell behind: skip the missed ticks rather than running
+                # back-to-back catch-up collections
+                missed = int((now - next_deadline) // interval) + 1
+                logger.warning(
+                    "system_monitoring_behind_schedule",
+                    missed_intervals=missed
+                )
+                next_deadline += missed * interval
             
-            # Network metrics (if available)
             try:
-                network = psutil.net_io_counters()
-                await metrics_collector.record_metric("system_network_bytes_sent", network.bytes_sent)
-                await metrics_collector.record_metric("system_network_bytes_recv", network.bytes_recv)
-                await metrics_collector.record_metric("system_network_packets_sent", network.packets_sent)
-                await metrics_collector.record_metric("system_network_packets_recv", network.packets_recv)
-            except Exception:
-                # Network metrics might not be available on all systems
-                pass
-            
-            # Process-specific metrics
-            process = psutil.Process()
+                await asyncio.sleep(next_deadline - now)
+            except asyncio.CancelledError:
+                break
+    
+    def _sample_cpu(self) -> Tuple[float, float]:
+        """
+        Read system and process CPU percentages without blocking
+        
+        Returns:
+            Tuple of (system_cpu_percent, process_cpu_percent)
+        """
+        with self._cpu_sample_lock:
+            now = time.monotonic()
+            if now - self._cpu_sample_ts >= _MIN_CPU_SAMPLE_INTERVAL:
+                self._cpu_sample = (
+                    self._system_cpu_percent(),
+                    self._process.cpu_percent(interval=None)
+                )
+                self._cpu_sample_ts = now
+            return self._cpu_sample
+    
+    def _system_cpu_percent(self) -> float:
+        """System-wide CPU usage since the previous call"""
+        if not procfs.PROCFS_AVAILABLE:
+            return psutil.cpu_percent(interval=None)
+        
+        busy, total = procfs.read_cpu_times()
+        prev_busy, prev_total = self._prev_cpu_times
+        self._prev_cpu_times = (busy, total)
+        elapsed = total - prev_total
+        return round(max(busy - prev_busy, 0) / elapsed * 100, 1) if elapsed > 0 else 0.0
+    
+    def _iso_timestamp(self) -> str:
+        """Current UTC time as an ISO 8601 string, truncated to the second"""
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_str = datetime.utcfromtimestamp(now).isoformat()
+            self._ts_sec = now
+        return self._ts_str
+    
+    @staticmethod
+    def _probe(sensor) -> bool:
+        """Check whether a psutil sensor works on this platform"""
+        try:
+            sensor()
+            return True
+        except Exception:
+            return False
+    
+    def _disk_usage(self) -> Tuple[int, int, int]:
+        """
+        Root filesystem usage
+        
+        Returns:
+            Tuple of (total, used, free) in bytes
+        """
+        if hasattr(os, "statvfs"):
+            st = os.statvfs('/')
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+        else:
+            disk = psutil.disk_usage('/')
+            used, free = disk.used, disk.free
+        return self._disk_total, used, free
+    
+    def _process_stats(self) -> Dict[str, int]:
+        """
+        Memory and thread counts of this process
+        
+        Returns:
+            Dictionary with ``rss``, ``vms`` and ``num_threads``
+        """
+        if procfs.PROCFS_AVAILABLE:
+            return procfs.read_self_status()
+        
+        # Read from a single psutil snapshot
+        process = self._process
+        with process.oneshot():
             process_memory = process.memory_info()
-            
-            await metrics_collector.record_metric("process_memory_rss", process_memory.rss)
-            await metrics_collector.record_metric("process_memory_vms", process_memory.vms)
-            await metrics_collector.record_metric("process_cpu_percent", process.cpu_percent())
-            await metrics_collector.record_metric("process_num_threads", process.num_threads())
-            
-            # File descriptor count (Unix-like systems)
-            try:
-                await metrics_collector.record_metric("process_num_fds", process.num_fds())
-            except (AttributeError, psutil.AccessDenied):
-                # Not available on Windows or access denied
-                pass
+            return {
+                "rss": process_memory.rss,
+                "vms": process_memory.vms,
+                "num_threads": process.num_threads()
+            }
+    
+    def _collect_sync(self) -> Dict[str, float]:
+        """
+        Sweep system resources for the periodic metrics
+        
+        Runs in a worker thread: every read here is blocking file I/O.
+        
+        Returns:
+            Mapping of metric name to value
+        """
+        # CPU metrics
+        cpu_percent, process_cpu_percent = self._sample_cpu()
+        
+        # Memory metrics
+        memory_total, memory_used, memory_available, memory_percent = _memory_usage()
+        
+        # Disk metrics
+        disk_total, disk_used, _ = self._disk_usage()
+        disk_percent = (disk_used / disk_total) * 100
+        
+        payload = {
+            "system_cpu_percent": cpu_percent,
+            "system_cpu_count": self._cpu_count,
+            "system_memory_total": memory_total,
+            "system_memory_used": memory_used,
+            "system_memory_percent": memory_percent,
+            "system_memory_available": memory_available,
+            "system_disk_total": disk_total,
+            "system_disk_used": disk_used,
+            "system_disk_percent": disk_percent
+        }
+        
+        # Network metrics (if available)
+        if self._has_net:
+            bytes_sent, bytes_recv, packets_sent, packets_recv = _network_counters()
+            payload["system_network_bytes_sent"] = bytes_sent
+            payload["system_network_bytes_recv"] = bytes_recv
+            payload["system_network_packets_sent"] = packets_sent
+            payload["system_network_packets_recv"] = packets_recv
+        
+        # Process-specific metrics
+        process_stats = self._process_stats()
+        payload["process_memory_rss"] = process_stats["rss"]
+        payload["process_memory_vms"] = process_stats["vms"]
+        payload["process_cpu_percent"] = process_cpu_percent
+        payload["process_num_threads"] = process_stats["num_threads"]
+        
+        # File descriptor count (Unix-like systems)
+        if self._has_fds:
+            payload["process_num_fds"] = self._process.num_fds()
+        
+        return payload
+    
+    async def _collect_system_metrics(self):
+        """Collect and record system resource metrics"""
+        try:
+            # Stamp the points with when they were sampled, not when the
+            # worker thread handed them back
+            sampled_at = time.time()
+            payload = await asyncio.to_thread(self._collect_sync)
+            await metrics_collector.record_metrics(payload, timestamp=sampled_at)
             
             logger.debug(
                 "system_metrics_collected",
-                cpu_percent=cpu_percent,
-                memory_percent=memory.percent,
-                disk_percent=(disk.used / disk.total) * 100
+                cpu_percent=payload["system_cpu_percent"],
+                memory_percent=payload["system_memory_percent"],
+                disk_percent=payload["system_disk_percent"]
             )
             
         except Exception as e:
@@ -135,44 +402,68 @@ class SystemResourceMonitor:
         """
         Get current system resource status
         
+        Bursts of callers within ``_STATUS_TTL`` seconds share one sample.
+        The sweep runs in a worker thread; callers arriving while it is in
+        flight wait on the lock and then reuse its result.
+        
         Returns:
             Dictionary with current system resource information
         """
+        cached = self._fresh_status()
+        if cached is not None:
+            return cached
+        
+        async with self._status_lock:
+            cached = self._fresh_status()
+            if cached is not None:
+                return cached
+            
+            status = await asyncio.to_thread(self._build_system_status)
+            if "error" not in status:
+                self._status_cache = status
+                self._status_ts = time.monotonic()
+            return dict(status)
+    
+    def _fresh_status(self) -> Optional[Dict[str, Any]]:
+        """Copy of the cached status if it is still within its TTL"""
+        if self._status_cache is not None and time.monotonic() - self._status_ts < _STATUS_TTL:
+            # Shallow copy: callers add their own top-level keys
+            return dict(self._status_cache)
+        return None
+    
+    def _build_system_status(self) -> Dict[str, Any]:
+        """Sweep system resources for the get_current_system_status payload (worker thread)"""
         try:
             # CPU information
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
+            cpu_percent, process_cpu_percent = self._sample_cpu()
             cpu_freq = psutil.cpu_freq()
             
             # Memory information
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
+            memory_total, memory_used, memory_available, memory_percent = _memory_usage()
+            swap_total, swap_used, swap_percent = _swap_usage()
             
             # Disk information
-            disk = psutil.disk_usage('/')
+            disk_total, disk_used, disk_free = self._disk_usage()
             
             # Process information
-            process = psutil.Process()
-            process_memory = process.memory_info()
+            process_stats = self._process_stats()
             
             # Network information (if available)
-            network_info = {}
-            try:
-                network = psutil.net_io_counters()
+            network_info = {"status": "unavailable"}
+            if self._has_net:
+                bytes_sent, bytes_recv, packets_sent, packets_recv = _network_counters()
                 network_info = {
-                    "bytes_sent": network.bytes_sent,
-                    "bytes_recv": network.bytes_recv,
-                    "packets_sent": network.packets_sent,
-                    "packets_recv": network.packets_recv
+                    "bytes_sent": bytes_sent,
+                    "bytes_recv": bytes_recv,
+                    "packets_sent": packets_sent,
+                    "packets_recv": packets_recv
                 }
-            except Exception:
-                network_info = {"status": "unavailable"}
             
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": self._iso_timestamp(),
                 "cpu": {
                     "percent": cpu_percent,
-                    "count": cpu_count,
+                    "count": self._cpu_count,
                     "frequency": {
                         "current": cpu_freq.current if cpu_freq else None,
                         "min": cpu_freq.min if cpu_freq else None,
@@ -180,29 +471,29 @@ class SystemResourceMonitor:
                     } if cpu_freq else None
                 },
                 "memory": {
-                    "total": memory.total,
-                    "used": memory.used,
-                    "available": memory.available,
-                    "percent": memory.percent,
+                    "total": memory_total,
+                    "used": memory_used,
+                    "available": memory_available,
+                    "percent": memory_percent,
                     "swap": {
-                        "total": swap.total,
-                        "used": swap.used,
-                        "percent": swap.percent
+                        "total": swap_total,
+                        "used": swap_used,
+                        "percent": swap_percent
                     }
                 },
                 "disk": {
-                    "total": disk.total,
-                    "used": disk.used,
-                    "free": disk.free,
-                    "percent": (disk.used / disk.total) * 100
+                    "total": disk_total,
+                    "used": disk_used,
+                    "free": disk_free,
+                    "percent": (disk_used / disk_total) * 100
                 },
                 "process": {
-                    "memory_rss": process_memory.rss,
-                    "memory_vms": process_memory.vms,
-                    "cpu_percent": process.cpu_percent(),
-                    "num_threads": process.num_threads(),
-                    "pid": process.pid,
-                    "create_time": process.create_time()
+                    "memory_rss": process_stats["rss"],
+                    "memory_vms": process_stats["vms"],
+                    "cpu_percent": process_cpu_percent,
+                    "num_threads": process_stats["num_threads"],
+                    "pid": self._pid,
+                    "create_time": self._create_time
                 },
                 "network": network_info
             }
@@ -213,7 +504,7 @@ class SystemResourceMonitor:
                 error=str(e)
             )
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": self._iso_timestamp(),
                 "error": str(e),
                 "status": "unavailable"
             }
@@ -2,34 +2,127 @@
 """
 OpenAPI specification validation script
 """
+import argparse
+import hashlib
 import json
+import os
+import pickle
 import yaml
 import sys
+from collections import defaultdict
 from pathlib import Path
+from types import SimpleNamespace
 
-def validate_openapi_spec():
-    """Validate the OpenAPI specification file"""
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+SPEC_PATH = Path(__file__).parent.parent / "docs" / "openapi.yaml"
+
+_HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch', 'options', 'head'})
+# Verbs whose examples and tags are reported
+_DOCUMENTED_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch'})
+
+def _read_spec_cache(cache_path, key):
+    """Return the cached parse for ``key``, or None if missing or stale"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, spec = pickle.load(f)
+    except Exception:
+        return None
+    return spec if cached_key == key else None
+
+def _write_spec_cache(cache_path, key, spec):
+    """Atomically store a parsed spec next to the YAML file"""
+    tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, spec), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is only an optimisation; never fail validation over it
+        tmp_path.unlink(missing_ok=True)
+
+def load_openapi_spec(spec_path=SPEC_PATH, use_cache=True):
+    """
+    Load and parse the OpenAPI specification file, returning None on failure
     
-    # Path to OpenAPI spec
-    spec_path = Path(__file__).parent.parent / "docs" / "openapi.yaml"
+    The parsed result is cached in a sibling ``.cache`` file keyed by the
+    YAML file's mtime and SHA-256, so unchanged specs skip the YAML parse.
+    """
     
     if not spec_path.exists():
         print(f"ERROR: OpenAPI spec not found at {spec_path}")
-        return False
+        return None
+    
+    cache_path = spec_path.with_name(spec_path.name + ".cache")
+    data = spec_path.read_bytes()
+    key = (spec_path.stat().st_mtime_ns, hashlib.sha256(data).hexdigest())
+    
+    spec = _read_spec_cache(cache_path, key) if use_cache else None
+    if spec is None:
+        try:
+            # Load and parse YAML
+            spec = yaml.load(data, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            print(f"ERROR: Invalid YAML syntax: {e}")
+            return None
+        
+        if use_cache:
+            _write_spec_cache(cache_path, key, spec)
+    
+    print("✓ OpenAPI YAML syntax is valid")
+    return spec
+
+def _scan_paths(paths):
+    """
+    Walk the paths section once, collecting everything the validation and
+    summary report on: operation and response-example counts, plus the
+    endpoints grouped by tag
+    """
+    operation_count = 0
+    example_count = 0
+    endpoints_by_tag = defaultdict(list)
+    
+    for path, methods in paths.items():
+        for method, operation in methods.items():
+            if method not in _HTTP_METHODS:
+                continue
+            operation_count += 1
+            
+            if method not in _DOCUMENTED_METHODS:
+                continue
+            
+            for tag in operation.get('tags', ['untagged']):
+                endpoints_by_tag[tag].append(f"{method.upper()} {path}")
+            
+            for status, response in operation.get('responses', {}).items():
+                for media_type, content in response.get('content', {}).items():
+                    if 'example' in content or 'examples' in content:
+                        example_count += 1
+    
+    return SimpleNamespace(
+        operation_count=operation_count,
+        example_count=example_count,
+        endpoints_by_tag=endpoints_by_tag
+    )
+
+def validate_openapi_spec(spec):
+    """
+    Validate the parsed OpenAPI specification
+    
+    Returns the path scan on success (for reuse by the summary), else None
+    """
     
     try:
-        # Load and parse YAML
-        with open(spec_path, 'r') as f:
-            spec = yaml.safe_load(f)
-        
-        print("✓ OpenAPI YAML syntax is valid")
-        
         # Basic structure validation
         required_fields = ['openapi', 'info', 'paths']
         for field in required_fields:
             if field not in spec:
                 print(f"ERROR: Missing required field '{field}'")
-                return False
+                return None
         
         print("✓ Required top-level fields present")
         
@@ -44,20 +137,15 @@ def validate_openapi_spec():
         for field in info_required:
             if field not in spec['info']:
                 print(f"ERROR: Missing required info field '{field}'")
-                return False
+                return None
         
         print("✓ Info section is valid")
         
         # Count paths and operations
         path_count = len(spec['paths'])
-        operation_count = 0
-        
-        for path, methods in spec['paths'].items():
-            for method in methods:
-                if method in ['get', 'post', 'put', 'delete', 'patch', 'options', 'head']:
-                    operation_count += 1
+        stats = _scan_paths(spec['paths'])
         
-        print(f"✓ Found {path_count} paths with {operation_count} operations")
+        print(f"✓ Found {path_count} paths with {stats.operation_count} operations")
         
         # Validate components section
         if 'components' in spec:
@@ -70,38 +158,19 @@ def validate_openapi_spec():
                 print(f"✓ Found {security_count} security schemes")
         
         # Check for examples
-        example_count = 0
-        for path, methods in spec['paths'].items():
-            for method, operation in methods.items():
-                if method in ['get', 'post', 'put', 'delete', 'patch']:
-                    if 'responses' in operation:
-                        for status, response in operation['responses'].items():
-                            if 'content' in response:
-                                for media_type, content in response['content'].items():
-                                    if 'example' in content or 'examples' in content:
-                                        example_count += 1
-        
-        print(f"✓ Found {example_count} response examples")
+        print(f"✓ Found {stats.example_count} response examples")
         
         print("\n🎉 OpenAPI specification validation passed!")
-        return True
+        return stats
         
-    except yaml.YAMLError as e:
-        print(f"ERROR: Invalid YAML syntax: {e}")
-        return False
     except Exception as e:
         print(f"ERROR: Validation failed: {e}")
-        return False
+        return None
 
-def generate_api_summary():
-    """Generate a summary of the API specification"""
-    
-    spec_path = Path(__file__).parent.parent / "docs" / "openapi.yaml"
+def generate_api_summary(spec, stats):
+    """Generate a summary of the parsed API specification from its path scan"""
     
     try:
-        with open(spec_path, 'r') as f:
-            spec = yaml.safe_load(f)
-        
         print("\n" + "="*50)
         print("API SPECIFICATION SUMMARY")
         print("="*50)
@@ -126,18 +195,7 @@ def generate_api_summary():
         # Paths by tag
         print(f"\nEndpoints by Tag:")
         
-        # Group paths by tag
-        paths_by_tag = {}
-        for path, methods in spec['paths'].items():
-            for method, operation in methods.items():
-                if method in ['get', 'post', 'put', 'delete', 'patch']:
-                    tags = operation.get('tags', ['untagged'])
-                    for tag in tags:
-                        if tag not in paths_by_tag:
-                            paths_by_tag[tag] = []
-                        paths_by_tag[tag].append(f"{method.upper()} {path}")
-        
-        for tag, endpoints in paths_by_tag.items():
+        for tag, endpoints in stats.endpoints_by_tag.items():
             print(f"\n  {tag.title()}:")
             for endpoint in endpoints:
                 print(f"    - {endpoint}")
@@ -155,10 +213,20 @@ def generate_api_summary():
         print(f"ERROR: Could not generate summary: {e}")
 
 if __name__ == "__main__":
-    success = validate_openapi_spec()
+    parser = argparse.ArgumentParser(description="Validate the OpenAPI specification")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always re-parse the YAML instead of using the cached parse"
+    )
+    args = parser.parse_args()
+    
+    # Parse once and share the result between validation and the summary
+    spec = load_openapi_spec(use_cache=not args.no_cache)
+    stats = validate_openapi_spec(spec) if spec is not None else None
     
-    if success:
-        generate_api_summary()
+    if stats is not None:
+        generate_api_summary(spec, stats)
         sys.exit(0)
     else:
         sys.exit(1)
\ No newline at end of file
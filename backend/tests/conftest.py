@@ -28,9 +28,9 @@ def temp_dir() -> Generator[str, None, None]:
         yield temp_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text_content() -> str:
-    """Sample resume text content for testing"""
+    """Sample resume text content for testing (immutable, shared per session)"""
     return """
 John Doe
 Software Engineer
@@ -180,16 +180,17 @@ def create_unsupported_file(temp_dir: str) -> str:
 def create_large_file(temp_dir: str) -> str:
     """Create a file that exceeds size limits"""
     large_path = os.path.join(temp_dir, "large_file.txt")
-    # Create a 15MB file (exceeds 10MB limit)
+    # Create a 15MB file (exceeds 10MB limit). Only its size matters, so
+    # extend it as a sparse file instead of building the bytes in memory
     with open(large_path, "wb") as f:
-        f.write(b"x" * (15 * 1024 * 1024))
+        f.truncate(15 * 1024 * 1024)
     
     return large_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_fastapi_upload_file():
-    """Create a mock FastAPI UploadFile"""
+    """Create a mock FastAPI UploadFile (stateless factory, shared per session)"""
     def _create_upload_file(content: bytes, filename: str, content_type: str):
         file_obj = BytesIO(content)
         upload_file = UploadFile(
@@ -7,57 +7,59 @@ including load testing, stress testing, and endurance testing.
 Requirements: 5.5, 6.6
 """
 import os
-from typing import Dict, Any
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping
+
+# Configurations are read-only: each test type overlays its overrides on
+# BASE_CONFIG without copying it. Callers that need changes build their own
+# dict, e.g. {**get_test_config("load"), "users": 10}
 
 # Base configuration
-BASE_CONFIG = {
+BASE_CONFIG = MappingProxyType({
     "host": os.getenv("PERFORMANCE_TEST_HOST", "http://localhost:8000"),
     "users": 50,
     "spawn_rate": 5,  # Users spawned per second
     "run_time": "5m",  # 5 minutes
     "response_time_threshold": 30.0,  # 30 seconds
     "success_rate_threshold": 95.0,  # 95% success rate
-}
+})
 
 # Load test configuration (normal expected load)
-LOAD_TEST_CONFIG = {
-    **BASE_CONFIG,
+LOAD_TEST_CONFIG = MappingProxyType(ChainMap({
     "users": 50,
     "spawn_rate": 5,
     "run_time": "10m",
     "test_name": "load_test",
     "description": "Normal expected load with 50 concurrent users"
-}
+}, BASE_CONFIG))
 
 # Stress test configuration (beyond normal capacity)
-STRESS_TEST_CONFIG = {
-    **BASE_CONFIG,
+STRESS_TEST_CONFIG = MappingProxyType(ChainMap({
     "users": 100,
     "spawn_rate": 10,
     "run_time": "5m",
     "test_name": "stress_test",
     "description": "Stress test with 100 concurrent users to find breaking point"
-}
+}, BASE_CONFIG))
 
 # Spike test configuration (sudden load increase)
-SPIKE_TEST_CONFIG = {
-    **BASE_CONFIG,
+SPIKE_TEST_CONFIG = MappingProxyType(ChainMap({
     "users": 200,
     "spawn_rate": 50,  # Rapid spawn rate for spike
     "run_time": "2m",
     "test_name": "spike_test",
     "description": "Spike test with rapid user increase to 200 users"
-}
+}, BASE_CONFIG))
 
 # Endurance test configuration (sustained load)
-ENDURANCE_TEST_CONFIG = {
-    **BASE_CONFIG,
+ENDURANCE_TEST_CONFIG = MappingProxyType(ChainMap({
     "users": 30,
     "spawn_rate": 2,
     "run_time": "30m",
     "test_name": "endurance_test",
     "description": "Endurance test with sustained load for 30 minutes"
-}
+}, BASE_CONFIG))
 
 # Performance thresholds for different endpoints
 ENDPOINT_THRESHOLDS = {
@@ -87,16 +89,38 @@ ENDPOINT_THRESHOLDS = {
     }
 }
 
-def get_test_config(test_type: str) -> Dict[str, Any]:
-    """Get configuration for specific test type"""
-    configs = {
-        "load": LOAD_TEST_CONFIG,
-        "stress": STRESS_TEST_CONFIG,
-        "spike": SPIKE_TEST_CONFIG,
-        "endurance": ENDURANCE_TEST_CONFIG
-    }
+def _make_validator(endpoint: str, threshold: Dict[str, float]) -> Callable[[float, float], Dict[str, bool]]:
+    """Specialise the endpoint threshold checks with the limits and result keys bound once"""
+    max_p95 = threshold["p95_response_time"]
+    min_success_rate = threshold["success_rate"]
+    response_time_key = f"{endpoint}_response_time"
+    success_rate_key = f"{endpoint}_success_rate"
+    
+    def validate(p95_time: float, success_rate: float) -> Dict[str, bool]:
+        return {
+            response_time_key: p95_time <= max_p95,
+            success_rate_key: success_rate >= min_success_rate
+        }
     
-    return configs.get(test_type, LOAD_TEST_CONFIG)
+    return validate
+
+# Per-endpoint validators, built once at import
+_ENDPOINT_VALIDATORS = {
+    endpoint: _make_validator(endpoint, threshold)
+    for endpoint, threshold in ENDPOINT_THRESHOLDS.items()
+}
+
+# Test type lookup, built once at import
+_TEST_CONFIGS = MappingProxyType({
+    "load": LOAD_TEST_CONFIG,
+    "stress": STRESS_TEST_CONFIG,
+    "spike": SPIKE_TEST_CONFIG,
+    "endurance": ENDURANCE_TEST_CONFIG
+})
+
+def get_test_config(test_type: str) -> Mapping[str, Any]:
+    """Get the read-only configuration for a specific test type"""
+    return _TEST_CONFIGS.get(test_type, LOAD_TEST_CONFIG)
 
 def validate_performance_requirements(stats: Dict[str, Any], endpoint: str = None) -> Dict[str, bool]:
     """
@@ -120,9 +144,8 @@ def validate_performance_requirements(stats: Dict[str, Any], endpoint: str = Non
     results["success_rate_requirement"] = success_rate >= 95.0
     
     # Endpoint-specific thresholds
-    if endpoint and endpoint in ENDPOINT_THRESHOLDS:
-        threshold = ENDPOINT_THRESHOLDS[endpoint]
-        results[f"{endpoint}_response_time"] = p95_time <= threshold["p95_response_time"]
-        results[f"{endpoint}_success_rate"] = success_rate >= threshold["success_rate"]
+    validator = _ENDPOINT_VALIDATORS.get(endpoint) if endpoint else None
+    if validator is not None:
+        results.update(validator(p95_time, success_rate))
     
     return results
\ No newline at end of file
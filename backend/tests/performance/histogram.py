@@ -0,0 +1,150 @@
+"""
+Mergeable log-linear histogram for load-test response times
+
+Shared by the locustfiles so they can record latencies in bounded memory
+and compute percentiles without keeping every sample. HistogramDumper writes
+the live histogram to the file run_tests.py names in LOCUST_HISTOGRAM_FILE.
+
+Requirements: 5.5, 6.6
+"""
+import math
+import os
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+import gevent
+import numpy as np
+
+
+class Histogram:
+    """
+    Log-linear histogram of response times with bounded memory
+
+    Each power of two is split into ``subbuckets`` logarithmic buckets, so a
+    value lands in bucket ``floor(log2(value) * subbuckets)`` and quantiles
+    carry about 1% relative error at the default of 64. Only non-empty
+    buckets are stored, and count/sum/min/max are kept exactly.
+    """
+
+    def __init__(self, subbuckets: int = 64):
+        self.subbuckets = subbuckets
+        self.buckets: Dict[int, int] = defaultdict(int)
+        # Zero and negative timings have no logarithm; they count as 0.0
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float):
+        """Record a single value in O(1)"""
+        if value > 0:
+            self.buckets[math.floor(math.log2(value) * self.subbuckets)] += 1
+        else:
+            value = 0.0
+            self.zero_count += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _bucket_arrays(self):
+        """Occupied bucket indices and their counts, in dict order"""
+        size = len(self.buckets)
+        indices = np.fromiter(self.buckets.keys(), dtype=np.int64, count=size)
+        counts = np.fromiter(self.buckets.values(), dtype=np.int64, count=size)
+        return indices, counts
+
+    def percentiles(self, percentiles: List[float]) -> List[float]:
+        """Estimate several percentiles with one vectorised pass over the buckets"""
+        if not self.buckets:
+            return [0.0] * len(percentiles)
+
+        targets = np.asarray(percentiles, dtype=np.float64) / 100 * self.count
+        indices, counts = self._bucket_arrays()
+        order = np.argsort(indices)
+        indices, counts = indices[order], counts[order].astype(np.float64)
+        cumulative = self.zero_count + np.cumsum(counts)
+
+        # First bucket whose cumulative count reaches each target; rounding
+        # can push p=100 just past the end, which clamps to the last bucket
+        slots = np.minimum(np.searchsorted(cumulative, targets), len(cumulative) - 1)
+        below = cumulative[slots] - counts[slots]
+        fraction = np.clip((targets - below) / counts[slots], 0.0, 1.0)
+        # Interpolate on the log scale between the bucket bounds
+        values = np.clip(np.exp2((indices[slots] + fraction) / self.subbuckets), self.min, self.max)
+        # Targets that fall among the zero timings resolve to 0.0
+        if self.zero_count:
+            values[targets <= self.zero_count] = 0.0
+        return values.tolist()
+
+    def merge(self, other: "Histogram"):
+        """Add another histogram's counts into this one"""
+        for index, in_bucket in other.buckets.items():
+            self.buckets[index] += in_bucket
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def save(self, path: str):
+        """Write the histogram as one .npz file, replacing any previous dump atomically"""
+        indices, counts = self._bucket_arrays()
+        summary = np.array([self.zero_count, self.count, self.total, self.min, self.max])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, subbuckets=self.subbuckets, indices=indices, counts=counts, summary=summary)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Histogram":
+        """Rebuild a histogram written by save() for offline percentile analysis"""
+        with np.load(path) as data:
+            histogram = cls(int(data["subbuckets"]))
+            histogram.buckets.update(zip(data["indices"].tolist(), data["counts"].tolist()))
+            zero_count, count, total, minimum, maximum = data["summary"].tolist()
+        histogram.zero_count = int(zero_count)
+        histogram.count = int(count)
+        histogram.total = total
+        histogram.min = minimum
+        histogram.max = maximum
+        return histogram
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class HistogramDumper:
+    """
+    Periodically dump a histogram while a locust test runs
+
+    Does nothing unless LOCUST_HISTOGRAM_FILE is set. start() spawns a
+    greenlet that saves every ``interval`` seconds; stop() ends it and
+    writes the final histogram.
+    """
+
+    def __init__(self, source: Callable[[], Histogram], interval: float = 10.0):
+        self.source = source
+        self.interval = interval
+        self.path = os.getenv("LOCUST_HISTOGRAM_FILE")
+        self._greenlet: Optional[gevent.Greenlet] = None
+
+    def _run(self):
+        while True:
+            gevent.sleep(self.interval)
+            self.source().save(self.path)
+
+    def start(self):
+        if self.path and self._greenlet is None:
+            self._greenlet = gevent.spawn(self._run)
+
+    def stop(self):
+        if self._greenlet is not None:
+            self._greenlet.kill()
+            self._greenlet = None
+        if self.path:
+            self.source().save(self.path)
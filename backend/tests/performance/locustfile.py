@@ -7,13 +7,19 @@ and validate the 30-second response time requirement for 95% of requests.
 Requirements: 5.5, 6.6
 """
 import os
-import json
+import sys
 import time
 import random
-from io import BytesIO
-from typing import Dict, Any, Optional
+import itertools
+import threading
+from typing import Dict, Any, List, Optional
+
+import orjson
 from locust import HttpUser, task, between, events
 from locust.exception import StopUser
+from urllib3.filepost import encode_multipart_formdata
+
+from histogram import Histogram, HistogramDumper
 
 # Test data and configuration
 TEST_JOB_DESCRIPTIONS = [
@@ -150,54 +156,133 @@ Machine Learning Pipeline (2020)
 • Achieved 92% accuracy in production environment
 """
 
+# Text-analysis request bodies, serialized once so the load generator spends
+# no CPU re-encoding the same few KB of JSON on every request
+PRECOMPUTED_PAYLOADS = [
+    orjson.dumps({
+        "job_description": job_description,
+        "job_title": "Software Engineer",
+        "resume_text": SAMPLE_RESUME_TEXT
+    })
+    for job_description in TEST_JOB_DESCRIPTIONS
+]
+
+# Fields every successful analysis response must carry
+_REQUIRED_ANALYZE_FIELDS = frozenset(("analysis_id", "match_score", "ai_feedback", "processing_time"))
+
+# Multipart upload body for a minimal PDF, encoded once and sent as raw bytes
+_PDF_BYTES = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n"
+_MULTIPART_BODY, _MULTIPART_CONTENT_TYPE = encode_multipart_formdata({
+    "file": ("test_resume.pdf", _PDF_BYTES, "application/pdf")
+})
+
+class _WorkerMetrics:
+    """Response times and error count recorded by a single worker"""
+
+    __slots__ = ("histogram", "error_count")
+
+    def __init__(self):
+        self.histogram = Histogram()
+        self.error_count = 0
+
+
 class PerformanceMetrics:
-    """Track performance metrics during load testing"""
+    """
+    Track performance metrics during load testing
+
+    Each worker (greenlet under locust's gevent patching, thread otherwise)
+    records into its own histogram, so the per-request path never touches
+    shared state. The worker histograms are merged when stats are read.
+    """
     
     def __init__(self):
-        self.response_times = []
-        self.error_count = 0
-        self.success_count = 0
+        self._local = threading.local()
+        self._workers: List[_WorkerMetrics] = []
         self.start_time = time.time()
+        # Merged view and percentile results, reused until a new response
+        # is recorded; keyed by the total recorded count
+        self._merged: Optional[Histogram] = None
+        self._percentile_cache: Dict[float, float] = {}
+    
+    def _worker(self) -> _WorkerMetrics:
+        try:
+            return self._local.metrics
+        except AttributeError:
+            worker = self._local.metrics = _WorkerMetrics()
+            self._workers.append(worker)
+            return worker
     
     def record_response(self, response_time: float, success: bool):
         """Record a response time and success status"""
-        self.response_times.append(response_time)
-        if success:
-            self.success_count += 1
-        else:
-            self.error_count += 1
+        worker = self._worker()
+        worker.histogram.record(response_time)
+        if not success:
+            worker.error_count += 1
+    
+    def merged_histogram(self) -> Histogram:
+        """Merge the per-worker histograms into one, cached until the next record"""
+        workers = list(self._workers)
+        count = sum(worker.histogram.count for worker in workers)
+        if self._merged is None or self._merged.count != count:
+            merged = Histogram()
+            for worker in workers:
+                merged.merge(worker.histogram)
+            self._merged = merged
+            self._percentile_cache = {}
+        return self._merged
+    
+    @property
+    def error_count(self) -> int:
+        return sum(worker.error_count for worker in list(self._workers))
+    
+    def get_percentiles(self, percentiles: List[float]) -> List[float]:
+        """Estimate several response time percentiles from the histogram"""
+        histogram = self.merged_histogram()
+        cache = self._percentile_cache
+        missing = [p for p in percentiles if p not in cache]
+        if missing:
+            cache.update(zip(missing, histogram.percentiles(missing)))
+        return [cache[p] for p in percentiles]
     
     def get_percentile(self, percentile: float) -> float:
         """Calculate response time percentile"""
-        if not self.response_times:
-            return 0.0
-        
-        sorted_times = sorted(self.response_times)
-        index = int(len(sorted_times) * percentile / 100)
-        return sorted_times[min(index, len(sorted_times) - 1)]
+        return self.get_percentiles([percentile])[0]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive performance statistics"""
-        if not self.response_times:
+        histogram = self.merged_histogram()
+        if not histogram.count:
             return {"error": "No response times recorded"}
         
+        p50, p95, p99 = self.get_percentiles([50, 95, 99])
+        error_count = self.error_count
+        success_count = histogram.count - error_count
+        
         return {
-            "total_requests": len(self.response_times),
-            "success_count": self.success_count,
-            "error_count": self.error_count,
-            "success_rate": self.success_count / len(self.response_times) * 100,
-            "avg_response_time": sum(self.response_times) / len(self.response_times),
-            "min_response_time": min(self.response_times),
-            "max_response_time": max(self.response_times),
-            "p50_response_time": self.get_percentile(50),
-            "p95_response_time": self.get_percentile(95),
-            "p99_response_time": self.get_percentile(99),
+            "total_requests": histogram.count,
+            "success_count": success_count,
+            "error_count": error_count,
+            "success_rate": success_count / histogram.count * 100,
+            "avg_response_time": histogram.mean,
+            "min_response_time": histogram.min,
+            "max_response_time": histogram.max,
+            "p50_response_time": p50,
+            "p95_response_time": p95,
+            "p99_response_time": p99,
             "test_duration": time.time() - self.start_time
         }
 
 # Global metrics instance
 metrics = PerformanceMetrics()
 
+# Dumps the merged histogram when run_tests.py asks for it
+histogram_dumper = HistogramDumper(metrics.merged_histogram)
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Start the periodic histogram dump when a target file is configured"""
+    histogram_dumper.start()
+
 @events.request.add_listener
 def record_request(request_type, name, response_time, response_length, response, context, exception, **kwargs):
     """Record all requests for performance analysis"""
@@ -207,25 +292,27 @@ def record_request(request_type, name, response_time, response_length, response,
 @events.test_stop.add_listener
 def on_test_stop(environment, **kwargs):
     """Print performance statistics when test stops"""
+    histogram_dumper.stop()
+    
     stats = metrics.get_stats()
     
-    print("\n" + "="*60)
-    print("PERFORMANCE TEST RESULTS")
-    print("="*60)
+    # Assemble the report and write it to stdout in one call
+    lines = ["", "="*60, "PERFORMANCE TEST RESULTS", "="*60]
     
     for key, value in stats.items():
         if isinstance(value, float):
-            print(f"{key}: {value:.2f}")
+            lines.append(f"{key}: {value:.2f}")
         else:
-            print(f"{key}: {value}")
+            lines.append(f"{key}: {value}")
     
     # Check 30-second requirement for 95% of requests
     p95_time = stats.get("p95_response_time", 0)
     requirement_met = p95_time <= 30000  # 30 seconds in milliseconds
     
-    print(f"\n30-second requirement (95% of requests): {'✓ PASSED' if requirement_met else '✗ FAILED'}")
-    print(f"P95 response time: {p95_time/1000:.2f} seconds")
-    print("="*60)
+    lines.append(f"\n30-second requirement (95% of requests): {'✓ PASSED' if requirement_met else '✗ FAILED'}")
+    lines.append(f"P95 response time: {p95_time/1000:.2f} seconds")
+    lines.append("="*60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 class SmartResumeUser(HttpUser):
     """
@@ -245,6 +332,11 @@ class SmartResumeUser(HttpUser):
         self.auth_token: Optional[str] = None
         self.resume_id: Optional[str] = None
         self.user_id: str = f"test_user_{random.randint(1000, 9999)}"
+        self._upload_headers: Dict[str, str] = {}
+        # Each user walks its own shuffled order of job descriptions, so
+        # tasks take the next one without touching the shared RNG
+        self._payload_cycle = itertools.cycle(random.sample(PRECOMPUTED_PAYLOADS, len(PRECOMPUTED_PAYLOADS)))
+        self._job_description_cycle = itertools.cycle(random.sample(TEST_JOB_DESCRIPTIONS, len(TEST_JOB_DESCRIPTIONS)))
     
     def on_start(self):
         """Initialize user session with authentication"""
@@ -265,6 +357,11 @@ class SmartResumeUser(HttpUser):
             "Authorization": f"Bearer {self.auth_token}",
             "Content-Type": "application/json"
         })
+        
+        # Upload headers swap the session's JSON Content-Type for the
+        # multipart one; rebuilt here so a new token is picked up
+        self._upload_headers = {k: v for k, v in self.client.headers.items() if k != "Content-Type"}
+        self._upload_headers["Content-Type"] = _MULTIPART_CONTENT_TYPE
     
     @task(1)
     def health_check(self):
@@ -287,28 +384,18 @@ class SmartResumeUser(HttpUser):
     @task(3)
     def upload_resume(self):
         """Test resume upload functionality"""
-        # Create a mock PDF file for upload
-        pdf_content = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n"
-        
-        files = {
-            'file': ('test_resume.pdf', BytesIO(pdf_content), 'application/pdf')
-        }
-        
-        # Remove Content-Type header for multipart upload
-        headers = {k: v for k, v in self.client.headers.items() if k != "Content-Type"}
-        
         with self.client.post(
             "/api/v1/upload", 
-            files=files, 
-            headers=headers,
+            data=_MULTIPART_BODY, 
+            headers=self._upload_headers,
             catch_response=True
         ) as response:
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     self.resume_id = data.get("resume_id")
                     response.success()
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     response.failure("Invalid JSON response")
             else:
                 response.failure(f"Upload failed: {response.status_code}")
@@ -316,29 +403,21 @@ class SmartResumeUser(HttpUser):
     @task(5)
     def analyze_resume_with_text(self):
         """Test resume analysis with direct text input (most common scenario)"""
-        job_description = random.choice(TEST_JOB_DESCRIPTIONS)
-        
-        payload = {
-            "job_description": job_description,
-            "job_title": "Software Engineer",
-            "resume_text": SAMPLE_RESUME_TEXT
-        }
-        
+        # Content-Type: application/json is already a session header
         with self.client.post(
             "/api/v1/analyze", 
-            json=payload,
+            data=next(self._payload_cycle),
             catch_response=True
         ) as response:
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     # Validate response structure
-                    required_fields = ["analysis_id", "match_score", "ai_feedback", "processing_time"]
-                    if all(field in data for field in required_fields):
+                    if _REQUIRED_ANALYZE_FIELDS.issubset(data):
                         response.success()
                     else:
                         response.failure("Missing required fields in response")
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     response.failure("Invalid JSON response")
             else:
                 response.failure(f"Analysis failed: {response.status_code}")
@@ -350,7 +429,7 @@ class SmartResumeUser(HttpUser):
             # Skip if no resume uploaded yet
             return
         
-        job_description = random.choice(TEST_JOB_DESCRIPTIONS)
+        job_description = next(self._job_description_cycle)
         
         payload = {
             "job_description": job_description,
@@ -360,7 +439,7 @@ class SmartResumeUser(HttpUser):
         
         with self.client.post(
             "/api/v1/analyze", 
-            json=payload,
+            data=orjson.dumps(payload),
             catch_response=True
         ) as response:
             if response.status_code == 200:
@@ -377,12 +456,12 @@ class SmartResumeUser(HttpUser):
         with self.client.get("/api/v1/resumes", catch_response=True) as response:
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if isinstance(data, list):
                         response.success()
                     else:
                         response.failure("Response is not a list")
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     response.failure("Invalid JSON response")
             else:
                 response.failure(f"Get resumes failed: {response.status_code}")
@@ -393,12 +472,12 @@ class SmartResumeUser(HttpUser):
         with self.client.get("/api/v1/analyses", catch_response=True) as response:
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     if isinstance(data, list):
                         response.success()
                     else:
                         response.failure("Response is not a list")
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     response.failure("Invalid JSON response")
             else:
                 response.failure(f"Get analysis history failed: {response.status_code}")
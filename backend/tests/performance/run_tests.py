@@ -11,24 +11,80 @@ import os
 import sys
 import subprocess
 import argparse
-import json
 import time
-from typing import Dict, Any, List
+import threading
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Deque, Dict, Any, List, Optional
 from pathlib import Path
 
+import orjson
+
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_dir))
 
 from tests.performance.config import get_test_config, validate_performance_requirements
 
+# Output lines kept per stream for the results file; long endurance runs
+# would otherwise hold their entire output in memory
+OUTPUT_TAIL_LINES = 10000
+
+# Results files stay indented like the json.dump(indent=2) output they replace
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Upper bound on waiting for the target to report healthy between tests
+HEALTH_WAIT_TIMEOUT = 30.0
+HEALTH_POLL_INTERVAL = 1.0
+
+
+def wait_for_healthy(host: str, timeout: float = HEALTH_WAIT_TIMEOUT) -> bool:
+    """
+    Poll the host's health endpoint until it answers 200 or the timeout expires
+    
+    Returns:
+        True if the host reported healthy in time
+    """
+    url = f"{host.rstrip('/')}/api/v1/health"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=HEALTH_POLL_INTERVAL) as response:
+                if response.status == 200:
+                    return True
+        except (urllib.error.URLError, OSError):
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(HEALTH_POLL_INTERVAL)
+
+
+def _run_tests_on_host(host: str, test_types: List[str]) -> List[Dict[str, Any]]:
+    """Run several tests back to back against one host (process pool worker)"""
+    return PerformanceTestRunner(host=host).run_sequence(test_types)
+
+
+def _tee(pipe: IO[str], sink: IO[str], tail: Deque[str]):
+    """Echo a subprocess pipe line by line while keeping a bounded tail"""
+    with pipe:
+        for line in pipe:
+            sink.write(line)
+            sink.flush()
+            tail.append(line)
+
 class PerformanceTestRunner:
     """Manages execution of performance tests with different configurations"""
     
     def __init__(self, host: str = "http://localhost:8000"):
         self.host = host
-        self.results_dir = Path(__file__).parent / "results"
+        self.test_dir = Path(__file__).parent
+        self.results_dir = self.test_dir / "results"
         self.results_dir.mkdir(exist_ok=True)
+        # Arguments shared by every run against this host; run_test only
+        # appends the locustfile and the per-test settings
+        self._base_cmd = ["locust", "--host", self.host, "--headless", "--print-stats"]
     
     def run_test(self, test_type: str, locustfile: str = "locustfile.py", **kwargs) -> Dict[str, Any]:
         """
@@ -42,8 +98,8 @@ class PerformanceTestRunner:
         Returns:
             Test results and validation status
         """
-        config = get_test_config(test_type)
-        config.update(kwargs)
+        # Per-run copy: the shared test configs are read-only
+        config = {**get_test_config(test_type), **kwargs}
         
         print(f"\n{'='*60}")
         print(f"RUNNING {test_type.upper()} TEST")
@@ -56,25 +112,23 @@ class PerformanceTestRunner:
         print(f"{'='*60}")
         
         # Prepare locust command
-        locust_file_path = Path(__file__).parent / locustfile
-        
         cmd = [
-            "locust",
-            "-f", str(locust_file_path),
-            "--host", self.host,
+            *self._base_cmd,
+            "-f", str(self.test_dir / locustfile),
             "--users", str(config["users"]),
             "--spawn-rate", str(config["spawn_rate"]),
             "--run-time", config["run_time"],
-            "--headless",
-            "--print-stats",
-            "--html", str(self.results_dir / f"{config['test_name']}_report.html"),
-            "--csv", str(self.results_dir / f"{config['test_name']}")
+            "--html", str(self.results_dir / f"{config['test_name']}_report.html")
         ]
+        # The locustfile dumps its response-time histogram here every few
+        # seconds, in place of locust's per-second CSV rewrites
+        histogram_file = self.results_dir / f"{config['test_name']}_histogram.npz"
+        env = {**os.environ, "LOCUST_HISTOGRAM_FILE": str(histogram_file)}
         
         # Run the test
         start_time = time.time()
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path(__file__).parent)
+            returncode, stdout, stderr = self._run_streaming(cmd, cwd=self.test_dir, env=env)
             end_time = time.time()
             
             # Parse results
@@ -82,21 +136,22 @@ class PerformanceTestRunner:
                 "test_type": test_type,
                 "config": config,
                 "duration": end_time - start_time,
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "success": returncode == 0,
+                "stdout": stdout,
+                "stderr": stderr,
+                "histogram_file": str(histogram_file),
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
             }
             
             # Save results
             results_file = self.results_dir / f"{config['test_name']}_results.json"
-            with open(results_file, 'w') as f:
-                json.dump(test_results, f, indent=2)
+            results_file.write_bytes(orjson.dumps(test_results, option=_JSON_OPTIONS))
             
             print(f"\nTest completed in {test_results['duration']:.2f} seconds")
             print(f"Results saved to: {results_file}")
             html_report_path = self.results_dir / f"{config['test_name']}_report.html"
             print(f"HTML report: {html_report_path}")
+            print(f"Histogram: {histogram_file}")
             
             return test_results
             
@@ -110,19 +165,75 @@ class PerformanceTestRunner:
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
             }
     
-    def run_all_tests(self) -> List[Dict[str, Any]]:
-        """Run all performance test scenarios"""
-        test_types = ["load", "stress", "spike"]  # Exclude endurance for quick runs
+    @staticmethod
+    def _run_streaming(cmd: List[str], cwd: Path, env: Optional[Dict[str, str]] = None) -> tuple:
+        """
+        Run a command, streaming its output to the console as it arrives
+        
+        Returns:
+            Tuple of (returncode, stdout_tail, stderr_tail), where each tail
+            holds at most OUTPUT_TAIL_LINES lines
+        """
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            # Undecodable output becomes U+FFFD once here, so the tails are
+            # always valid UTF-8 when the results are serialized
+            errors="replace", cwd=cwd, env=env
+        )
+        stdout_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        readers = [
+            threading.Thread(target=_tee, args=(process.stdout, sys.stdout, stdout_tail), daemon=True),
+            threading.Thread(target=_tee, args=(process.stderr, sys.stderr, stderr_tail), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        returncode = process.wait()
+        for reader in readers:
+            reader.join()
+        return returncode, "".join(stdout_tail), "".join(stderr_tail)
+    
+    def run_sequence(self, test_types: List[str]) -> List[Dict[str, Any]]:
+        """Run tests one after another, waiting for the host to recover in between"""
         results = []
         
-        for test_type in test_types:
-            result = self.run_test(test_type)
-            results.append(result)
-            
-            # Brief pause between tests
-            if test_type != test_types[-1]:
-                print("\nWaiting 30 seconds before next test...")
-                time.sleep(30)
+        for index, test_type in enumerate(test_types):
+            if index:
+                print(f"\nWaiting for {self.host} to report healthy before next test...")
+                if not wait_for_healthy(self.host):
+                    print(f"Warning: {self.host} not healthy after {HEALTH_WAIT_TIMEOUT:.0f}s, continuing")
+            results.append(self.run_test(test_type))
+        
+        return results
+    
+    def run_all_tests(self, hosts: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Run all performance test scenarios
+        
+        Args:
+            hosts: Independent target hosts; tests are spread across them
+                round-robin and each host's share runs in its own process.
+                Defaults to this runner's host only.
+        """
+        test_types = ["load", "stress", "spike"]  # Exclude endurance for quick runs
+        hosts = hosts or [self.host]
+        
+        if len(hosts) == 1:
+            results = PerformanceTestRunner(host=hosts[0]).run_sequence(test_types)
+        else:
+            assignments = {host: test_types[index::len(hosts)] for index, host in enumerate(hosts)}
+            assignments = {host: types for host, types in assignments.items() if types}
+            with ProcessPoolExecutor(max_workers=len(assignments)) as executor:
+                futures = {
+                    host: executor.submit(_run_tests_on_host, host, types)
+                    for host, types in assignments.items()
+                }
+                by_type = {
+                    result["test_type"]: result
+                    for future in futures.values()
+                    for result in future.result()
+                }
+            results = [by_type[test_type] for test_type in test_types]
         
         # Generate summary report
         self.generate_summary_report(results)
@@ -158,8 +269,7 @@ class PerformanceTestRunner:
             "test_results": results
         }
         
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        summary_file.write_bytes(orjson.dumps(summary, option=_JSON_OPTIONS))
         
         print(f"\n{'='*60}")
         print("TEST SUMMARY")
@@ -178,6 +288,10 @@ def main():
         default="http://localhost:8000",
         help="Target host for testing (default: http://localhost:8000)"
     )
+    parser.add_argument(
+        "--hosts",
+        help="Comma-separated independent hosts to spread --test-type all across in parallel"
+    )
     parser.add_argument(
         "--test-type",
         choices=["load", "stress", "spike", "endurance", "scenario", "all"],
@@ -215,7 +329,8 @@ def main():
     
     # Run tests based on type
     if args.test_type == "all":
-        runner.run_all_tests()
+        hosts = [host.strip() for host in args.hosts.split(",") if host.strip()] if args.hosts else None
+        runner.run_all_tests(hosts=hosts)
     elif args.test_type == "scenario":
         runner.run_scenario_tests()
     else:
@@ -6,141 +6,67 @@ aspects of system performance under various load conditions.
 
 Requirements: 5.5, 6.6
 """
-import time
 import json
 import random
 from typing import Dict, Any, List
-from locust import HttpUser, task, between, events
+import orjson
+from locust import task, between, events
+from locust.contrib.fasthttp import FastHttpUser
 from locust.exception import StopUser
+from urllib3.filepost import encode_multipart_formdata
 
 from config import ENDPOINT_THRESHOLDS, validate_performance_requirements
+from histogram import Histogram, HistogramDumper
 
-class AnalysisHeavyUser(HttpUser):
-    """
-    User focused on analysis endpoints - tests the core functionality
-    that must meet the 30-second response time requirement
-    """
-    
-    wait_time = between(2, 5)
-    weight = 3  # Higher weight for more analysis-focused users
-    
-    def on_start(self):
-        """Initialize with mock authentication"""
-        self.client.headers.update({
-            "Authorization": f"Bearer mock_token_{random.randint(1000, 9999)}",
-            "Content-Type": "application/json"
-        })
-    
-    @task(10)
-    def analyze_software_engineer_resume(self):
-        """Test analysis for software engineer positions"""
-        payload = {
-            "job_description": """
+# Analysis request bodies, serialized once at import; the users post the
+# bytes as-is with the JSON headers built in on_start
+_SWE_BODY = orjson.dumps({
+    "job_description": """
             Senior Software Engineer position requiring Python, JavaScript, React, 
             FastAPI, PostgreSQL, AWS, Docker, and Kubernetes experience. 
             Must have 5+ years of full-stack development experience.
             """,
-            "job_title": "Senior Software Engineer",
-            "resume_text": """
+    "job_title": "Senior Software Engineer",
+    "resume_text": """
             John Smith - Senior Software Engineer
             6 years experience in Python, JavaScript, React, FastAPI, PostgreSQL.
             Worked with AWS, Docker, Kubernetes. Led development teams.
             Built scalable microservices and web applications.
             """
-        }
-        
-        start_time = time.time()
-        with self.client.post("/api/v1/analyze", json=payload, catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-            
-            if response.status_code == 200:
-                if response_time <= 30000:  # 30-second requirement
-                    response.success()
-                else:
-                    response.failure(f"Response time {response_time:.0f}ms exceeds 30s requirement")
-            else:
-                response.failure(f"Analysis failed: {response.status_code}")
-    
-    @task(8)
-    def analyze_data_scientist_resume(self):
-        """Test analysis for data scientist positions"""
-        payload = {
-            "job_description": """
+})
+
+_DS_BODY = orjson.dumps({
+    "job_description": """
             Data Scientist role requiring Python, R, machine learning, TensorFlow,
             scikit-learn, pandas, SQL, and statistical analysis experience.
             PhD or Master's degree preferred.
             """,
-            "job_title": "Data Scientist",
-            "resume_text": """
+    "job_title": "Data Scientist",
+    "resume_text": """
             Dr. Jane Doe - Data Scientist
             PhD in Statistics, 4 years ML experience. Expert in Python, R, TensorFlow,
             scikit-learn, pandas, SQL. Published research in machine learning.
             Built predictive models and data pipelines.
             """
-        }
-        
-        start_time = time.time()
-        with self.client.post("/api/v1/analyze", json=payload, catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
-            
-            if response.status_code == 200:
-                if response_time <= 30000:
-                    response.success()
-                else:
-                    response.failure(f"Response time {response_time:.0f}ms exceeds 30s requirement")
-            else:
-                response.failure(f"Analysis failed: {response.status_code}")
-    
-    @task(5)
-    def analyze_devops_resume(self):
-        """Test analysis for DevOps positions"""
-        payload = {
-            "job_description": """
+})
+
+_DEVOPS_BODY = orjson.dumps({
+    "job_description": """
             DevOps Engineer position requiring AWS, Kubernetes, Docker, Terraform,
             Jenkins, Python scripting, and Linux administration experience.
             Experience with monitoring tools and CI/CD pipelines required.
             """,
-            "job_title": "DevOps Engineer",
-            "resume_text": """
+    "job_title": "DevOps Engineer",
+    "resume_text": """
             Mike Johnson - DevOps Engineer
             5 years DevOps experience. Expert in AWS, Kubernetes, Docker, Terraform.
             Built CI/CD pipelines with Jenkins. Python scripting and Linux admin.
             Implemented monitoring with Prometheus and Grafana.
             """
-        }
-        
-        start_time = time.time()
-        with self.client.post("/api/v1/analyze", json=payload, catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
-            
-            if response.status_code == 200:
-                if response_time <= 30000:
-                    response.success()
-                else:
-                    response.failure(f"Response time {response_time:.0f}ms exceeds 30s requirement")
-            else:
-                response.failure(f"Analysis failed: {response.status_code}")
+})
 
-class UploadHeavyUser(HttpUser):
-    """
-    User focused on document upload functionality
-    Tests file processing performance under load
-    """
-    
-    wait_time = between(3, 8)
-    weight = 2
-    
-    def on_start(self):
-        """Initialize with mock authentication"""
-        self.client.headers.update({
-            "Authorization": f"Bearer mock_token_{random.randint(1000, 9999)}"
-        })
-    
-    @task(5)
-    def upload_pdf_resume(self):
-        """Test PDF resume upload performance"""
-        # Create mock PDF content
-        pdf_content = b"""%PDF-1.4
+# Upload fixtures shared by every UploadHeavyUser; only the name nonce varies
+_PDF_BYTES = b"""%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -189,17 +115,108 @@ trailer
 startxref
 299
 %%EOF"""
+
+_TXT_TEMPLATE = """
+        Resume Content {nonce}
         
-        files = {
-            'file': (f'resume_{random.randint(1000, 9999)}.pdf', pdf_content, 'application/pdf')
-        }
+        Name: Test User
+        Email: test@example.com
         
-        # Remove Content-Type header for multipart upload
-        headers = {k: v for k, v in self.client.headers.items() if k != "Content-Type"}
+        Experience:
+        - Software Engineer at TechCorp (2020-2023)
+        - Junior Developer at StartupXYZ (2018-2020)
         
-        start_time = time.time()
-        with self.client.post("/api/v1/upload", files=files, headers=headers, catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+        Skills:
+        - Python, JavaScript, React, FastAPI
+        - PostgreSQL, MongoDB, Redis
+        - AWS, Docker, Kubernetes
+        """
+
+class AnalysisHeavyUser(FastHttpUser):
+    """
+    User focused on analysis endpoints - tests the core functionality
+    that must meet the 30-second response time requirement
+    """
+    
+    wait_time = between(2, 5)
+    weight = 3  # Higher weight for more analysis-focused users
+    
+    def on_start(self):
+        """Initialize with mock authentication"""
+        # FastHttpSession has no session-wide headers; each request passes these
+        self._headers = {
+            "Authorization": f"Bearer mock_token_{random.randint(1000, 9999)}",
+            "Content-Type": "application/json"
+        }
+    
+    @task(10)
+    def analyze_software_engineer_resume(self):
+        """Test analysis for software engineer positions"""
+        with self.client.post("/api/v1/analyze", data=_SWE_BODY, headers=self._headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]  # Locust's own timing, in milliseconds
+            
+            if response.status_code == 200:
+                if response_time <= 30000:  # 30-second requirement
+                    response.success()
+                else:
+                    response.failure(f"Response time {response_time:.0f}ms exceeds 30s requirement")
+            else:
+                response.failure(f"Analysis failed: {response.status_code}")
+    
+    @task(8)
+    def analyze_data_scientist_resume(self):
+        """Test analysis for data scientist positions"""
+        with self.client.post("/api/v1/analyze", data=_DS_BODY, headers=self._headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]
+            
+            if response.status_code == 200:
+                if response_time <= 30000:
+                    response.success()
+                else:
+                    response.failure(f"Response time {response_time:.0f}ms exceeds 30s requirement")
+            else:
+                response.failure(f"Analysis failed: {response.status_code}")
+    
+    @task(5)
+    def analyze_devops_resume(self):
+        """Test analysis for DevOps positions"""
+        with self.client.post("/api/v1/analyze", data=_DEVOPS_BODY, headers=self._headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]
+            
+            if response.status_code == 200:
+                if response_time <= 30000:
+                    response.success()
+                else:
+                    response.failure(f"Response time {response_time:.0f}ms exceeds 30s requirement")
+            else:
+                response.failure(f"Analysis failed: {response.status_code}")
+
+class UploadHeavyUser(FastHttpUser):
+    """
+    User focused on document upload functionality
+    Tests file processing performance under load
+    """
+    
+    wait_time = between(3, 8)
+    weight = 2
+    
+    def on_start(self):
+        """Initialize with mock authentication"""
+        # Each upload adds its own multipart Content-Type to these
+        self._upload_headers = {
+            "Authorization": f"Bearer mock_token_{random.randint(1000, 9999)}"
+        }
+    
+    @task(5)
+    def upload_pdf_resume(self):
+        """Test PDF resume upload performance"""
+        body, content_type = encode_multipart_formdata({
+            'file': (f'resume_{random.getrandbits(16)}.pdf', _PDF_BYTES, 'application/pdf')
+        })
+        headers = {**self._upload_headers, "Content-Type": content_type}
+        
+        with self.client.post("/api/v1/upload", data=body, headers=headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]
             
             if response.status_code == 200:
                 if response_time <= 15000:  # 15-second threshold for uploads
@@ -212,31 +229,15 @@ startxref
     @task(3)
     def upload_text_resume(self):
         """Test text resume upload performance"""
-        text_content = f"""
-        Resume Content {random.randint(1000, 9999)}
-        
-        Name: Test User
-        Email: test@example.com
+        text_content = _TXT_TEMPLATE.format(nonce=random.getrandbits(16)).encode('utf-8')
         
-        Experience:
-        - Software Engineer at TechCorp (2020-2023)
-        - Junior Developer at StartupXYZ (2018-2020)
-        
-        Skills:
-        - Python, JavaScript, React, FastAPI
-        - PostgreSQL, MongoDB, Redis
-        - AWS, Docker, Kubernetes
-        """.encode('utf-8')
-        
-        files = {
-            'file': (f'resume_{random.randint(1000, 9999)}.txt', text_content, 'text/plain')
-        }
-        
-        headers = {k: v for k, v in self.client.headers.items() if k != "Content-Type"}
+        body, content_type = encode_multipart_formdata({
+            'file': (f'resume_{random.getrandbits(16)}.txt', text_content, 'text/plain')
+        })
+        headers = {**self._upload_headers, "Content-Type": content_type}
         
-        start_time = time.time()
-        with self.client.post("/api/v1/upload", files=files, headers=headers, catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+        with self.client.post("/api/v1/upload", data=body, headers=headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]
             
             if response.status_code == 200:
                 if response_time <= 10000:  # 10-second threshold for text uploads
@@ -246,7 +247,7 @@ startxref
             else:
                 response.failure(f"Upload failed: {response.status_code}")
 
-class HealthCheckUser(HttpUser):
+class HealthCheckUser(FastHttpUser):
     """
     User focused on health check and monitoring endpoints
     Tests system monitoring performance
@@ -258,9 +259,8 @@ class HealthCheckUser(HttpUser):
     @task(10)
     def basic_health_check(self):
         """Test basic health check performance"""
-        start_time = time.time()
         with self.client.get("/api/v1/health", catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+            response_time = response.request_meta["response_time"]
             
             if response.status_code == 200:
                 if response_time <= 1000:  # 1-second threshold for health checks
@@ -273,9 +273,8 @@ class HealthCheckUser(HttpUser):
     @task(5)
     def detailed_health_check(self):
         """Test detailed health check performance"""
-        start_time = time.time()
         with self.client.get("/api/v1/health/detailed", catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+            response_time = response.request_meta["response_time"]
             
             if response.status_code in [200, 503]:  # 503 acceptable for degraded state
                 if response_time <= 5000:  # 5-second threshold for detailed checks
@@ -288,9 +287,8 @@ class HealthCheckUser(HttpUser):
     @task(3)
     def system_metrics(self):
         """Test system metrics endpoint performance"""
-        start_time = time.time()
         with self.client.get("/api/v1/metrics", catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+            response_time = response.request_meta["response_time"]
             
             if response.status_code == 200:
                 if response_time <= 3000:  # 3-second threshold for metrics
@@ -300,7 +298,7 @@ class HealthCheckUser(HttpUser):
             else:
                 response.failure(f"Metrics failed: {response.status_code}")
 
-class BrowsingUser(HttpUser):
+class BrowsingUser(FastHttpUser):
     """
     User focused on browsing and retrieval operations
     Tests data retrieval performance
@@ -311,17 +309,17 @@ class BrowsingUser(HttpUser):
     
     def on_start(self):
         """Initialize with mock authentication"""
-        self.client.headers.update({
+        # FastHttpSession has no session-wide headers; each request passes these
+        self._headers = {
             "Authorization": f"Bearer mock_token_{random.randint(1000, 9999)}",
             "Content-Type": "application/json"
-        })
+        }
     
     @task(5)
     def get_user_resumes(self):
         """Test resume listing performance"""
-        start_time = time.time()
-        with self.client.get("/api/v1/resumes", catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+        with self.client.get("/api/v1/resumes", headers=self._headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]
             
             if response.status_code == 200:
                 if response_time <= 3000:  # 3-second threshold for resume listing
@@ -334,9 +332,8 @@ class BrowsingUser(HttpUser):
     @task(5)
     def get_analysis_history(self):
         """Test analysis history retrieval performance"""
-        start_time = time.time()
-        with self.client.get("/api/v1/analyses", catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+        with self.client.get("/api/v1/analyses", headers=self._headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]
             
             if response.status_code == 200:
                 if response_time <= 5000:  # 5-second threshold for analysis history
@@ -352,9 +349,8 @@ class BrowsingUser(HttpUser):
         # Use a mock analysis ID
         analysis_id = f"mock-analysis-{random.randint(1000, 9999)}"
         
-        start_time = time.time()
-        with self.client.get(f"/api/v1/analyses/{analysis_id}", catch_response=True) as response:
-            response_time = (time.time() - start_time) * 1000
+        with self.client.get(f"/api/v1/analyses/{analysis_id}", headers=self._headers, catch_response=True) as response:
+            response_time = response.request_meta["response_time"]
             
             if response.status_code in [200, 404]:  # 404 acceptable for non-existent analysis
                 if response_time <= 2000:  # 2-second threshold for specific analysis
@@ -364,21 +360,30 @@ class BrowsingUser(HttpUser):
             else:
                 response.failure(f"Specific analysis failed: {response.status_code}")
 
-# Performance validation events
+# Performance validation events; response times stream into histograms so
+# memory stays bounded however long the run
 performance_stats = {
     "total_requests": 0,
     "failed_requests": 0,
-    "response_times": [],
+    "response_times": Histogram(),
     "endpoint_stats": {}
 }
 
+# Dumps the overall response-time histogram when run_tests.py asks for it
+histogram_dumper = HistogramDumper(lambda: performance_stats["response_times"])
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Start the periodic histogram dump when a target file is configured"""
+    histogram_dumper.start()
+
 @events.request.add_listener
 def track_performance(request_type, name, response_time, response_length, response, context, exception, **kwargs):
     """Track detailed performance statistics"""
     global performance_stats
     
     performance_stats["total_requests"] += 1
-    performance_stats["response_times"].append(response_time)
+    performance_stats["response_times"].record(response_time)
     
     if exception or (response and response.status_code >= 400):
         performance_stats["failed_requests"] += 1
@@ -388,12 +393,12 @@ def track_performance(request_type, name, response_time, response_length, respon
         performance_stats["endpoint_stats"][name] = {
             "requests": 0,
             "failures": 0,
-            "response_times": []
+            "response_times": Histogram()
         }
     
     endpoint_stats = performance_stats["endpoint_stats"][name]
     endpoint_stats["requests"] += 1
-    endpoint_stats["response_times"].append(response_time)
+    endpoint_stats["response_times"].record(response_time)
     
     if exception or (response and response.status_code >= 400):
         endpoint_stats["failures"] += 1
@@ -403,21 +408,21 @@ def validate_performance_requirements_on_stop(environment, **kwargs):
     """Validate performance requirements when test completes"""
     global performance_stats
     
+    histogram_dumper.stop()
+    
     print("\n" + "="*80)
     print("PERFORMANCE REQUIREMENTS VALIDATION")
     print("="*80)
     
-    if not performance_stats["response_times"]:
+    if not performance_stats["response_times"].count:
         print("No performance data collected!")
         return
     
     # Calculate overall statistics
-    response_times = sorted(performance_stats["response_times"])
     total_requests = performance_stats["total_requests"]
     failed_requests = performance_stats["failed_requests"]
     
-    p95_index = int(len(response_times) * 0.95)
-    p95_time = response_times[p95_index] if p95_index < len(response_times) else response_times[-1]
+    p95_time = performance_stats["response_times"].percentiles([95])[0]
     
     success_rate = ((total_requests - failed_requests) / total_requests) * 100 if total_requests > 0 else 0
     
@@ -446,9 +451,8 @@ def validate_performance_requirements_on_stop(environment, **kwargs):
     # Endpoint-specific validation
     print("ENDPOINT-SPECIFIC PERFORMANCE:")
     for endpoint, stats in performance_stats["endpoint_stats"].items():
-        if stats["response_times"]:
-            endpoint_times = sorted(stats["response_times"])
-            endpoint_p95 = endpoint_times[int(len(endpoint_times) * 0.95)]
+        if stats["response_times"].count:
+            endpoint_p95 = stats["response_times"].percentiles([95])[0]
             endpoint_success_rate = ((stats["requests"] - stats["failures"]) / stats["requests"]) * 100
             
             threshold = ENDPOINT_THRESHOLDS.get(endpoint, {"p95_response_time": 30000, "success_rate": 95.0})
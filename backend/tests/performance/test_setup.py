@@ -44,6 +44,7 @@ def test_performance_modules():
     
     modules_to_test = [
         "config",
+        "histogram",
         "locustfile", 
         "test_scenarios",
         "run_tests",
@@ -0,0 +1,58 @@
+"""
+Unit tests for the async processing pipeline
+"""
+import asyncio
+import pytest
+
+from app.utils.async_utils import AsyncProcessingPipeline
+
+
+class TestAsyncProcessingPipeline:
+    """Test cases for the shared concurrency limit"""
+    
+    @pytest.fixture
+    def pipeline(self):
+        return AsyncProcessingPipeline()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent", [0, -1])
+    async def test_set_concurrency_rejects_limits_below_one(self, pipeline, max_concurrent):
+        """Test that a limit that could never admit work is rejected"""
+        with pytest.raises(ValueError):
+            await pipeline.set_concurrency(max_concurrent)
+    
+    @pytest.mark.asyncio
+    async def test_limit_can_be_lowered_and_raised_mid_flight(self, pipeline):
+        """Test that resizing the limit while a call is running is respected"""
+        await pipeline.set_concurrency(4)
+        active = 0
+        phase = "initial"
+        peaks = {"initial": 0, "lowered": 0, "raised": 0}
+        started = {"initial": 0, "lowered": 0, "raised": 0}
+        
+        async def processor(item):
+            nonlocal active
+            active += 1
+            started[phase] += 1
+            peaks[phase] = max(peaks[phase], active)
+            await asyncio.sleep(0.005)
+            active -= 1
+            return item * 2
+        
+        task = asyncio.ensure_future(pipeline.process_with_semaphore(range(20), processor))
+        while started["initial"] < 4:
+            await asyncio.sleep(0)
+        assert peaks["initial"] == 4
+        
+        phase = "lowered"
+        await pipeline.set_concurrency(1)
+        while started["lowered"] < 3:
+            await asyncio.sleep(0.001)
+        
+        phase = "raised"
+        await pipeline.set_concurrency(3)
+        
+        results = await asyncio.wait_for(task, timeout=5)
+        assert results == [item * 2 for item in range(20)]
+        assert peaks["lowered"] == 1
+        assert peaks["raised"] == 3
@@ -36,7 +36,7 @@ class TestDocumentService:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "resume.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/test.pdf"
             }
             
             # Mock TemporaryFileManager and PDF processing
@@ -45,7 +45,6 @@ class TestDocumentService:
                 
                 # Setup temp file manager
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/test.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -75,12 +74,11 @@ class TestDocumentService:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "scanned.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/scanned.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/scanned.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -133,12 +131,11 @@ class TestDocumentService:
             mock_validate.return_value = {
                 "detected_mime_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 "safe_filename": "resume.docx",
-                "content": docx_content
+                "content_path": docx_path
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = docx_path
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -159,7 +156,7 @@ class TestDocumentService:
             mock_validate.return_value = {
                 "detected_mime_type": "text/plain",
                 "safe_filename": "resume.txt",
-                "content": text_content
+                "content_path": "/tmp/resume.txt"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager, \
@@ -167,8 +164,6 @@ class TestDocumentService:
                  patch('os.path.getsize', return_value=len(text_content)):
                 
                 mock_context = Mock()
-                temp_path = "/tmp/resume.txt"
-                mock_context.create_temp_file.return_value = temp_path
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -189,7 +184,7 @@ class TestDocumentService:
                     assert result.text == sample_text_content.strip()
     
     @pytest.mark.asyncio
-    async def test_unsupported_file_format(self, document_service, mock_fastapi_upload_file):
+    async def test_unsupported_file_format(self, document_service, mock_fastapi_upload_file, temp_dir):
         """Test handling of unsupported file formats"""
         exe_content = b"MZ\x90\x00"  # PE executable header
         upload_file = mock_fastapi_upload_file(exe_content, "malware.exe", "application/x-executable")
@@ -198,7 +193,8 @@ class TestDocumentService:
             mock_validate.return_value = {
                 "detected_mime_type": "application/x-executable",
                 "safe_filename": "malware.exe",
-                "content": exe_content
+                # The real TemporaryFileManager deletes this, so keep it in a throwaway dir
+                "content_path": os.path.join(temp_dir, "malware.exe")
             }
             
             with pytest.raises(UnsupportedFormatError) as exc_info:
@@ -217,12 +213,11 @@ class TestDocumentService:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "corrupted.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/corrupted.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/corrupted.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -285,13 +280,12 @@ class TestDocumentService:
             mock_validate.return_value = {
                 "detected_mime_type": "text/plain",
                 "safe_filename": "resume.txt",
-                "content": text_content
+                "content_path": "/tmp/resume.txt"
             }
             
             # Track TemporaryFileManager context manager usage
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/resume.txt"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -308,6 +302,50 @@ class TestDocumentService:
                     mock_temp_manager.assert_called_once()
                     mock_temp_manager.return_value.__enter__.assert_called_once()
                     mock_temp_manager.return_value.__exit__.assert_called_once()
+                    mock_context.track.assert_called_once_with("/tmp/resume.txt")
+    
+    @pytest.mark.asyncio
+    async def test_validate_upload_file_streams_to_disk(self, mock_fastapi_upload_file, sample_text_content):
+        """Test that uploads are spooled to a temp file and hashed while streaming"""
+        import hashlib
+        from app.utils.file_utils import validate_upload_file
+        
+        text_content = sample_text_content.encode('utf-8')
+        upload_file = mock_fastapi_upload_file(text_content, "resume.txt", "text/plain")
+        
+        result = await validate_upload_file(upload_file)
+        try:
+            assert "content" not in result
+            assert result["file_size"] == len(text_content)
+            assert result["content_sha256"] == hashlib.sha256(text_content).hexdigest()
+            with open(result["content_path"], "rb") as f:
+                assert f.read() == text_content
+        finally:
+            os.unlink(result["content_path"])
+    
+    @pytest.mark.asyncio
+    async def test_validate_upload_file_rejects_oversized_stream(self, mock_fastapi_upload_file):
+        """Test that oversized uploads are rejected without spooling to disk"""
+        import tempfile
+        from app.utils.file_utils import validate_upload_file
+        
+        upload_file = mock_fastapi_upload_file(b"x" * 2048, "big.txt", "text/plain")
+        spool_paths = []
+        real_mkstemp = tempfile.mkstemp
+        
+        def recording_mkstemp(*args, **kwargs):
+            fd, path = real_mkstemp(*args, **kwargs)
+            spool_paths.append(path)
+            return fd, path
+        
+        with patch('app.utils.file_utils.settings') as mock_settings, \
+             patch('app.utils.file_utils.tempfile.mkstemp', side_effect=recording_mkstemp):
+            mock_settings.MAX_FILE_SIZE = 1024
+            with pytest.raises(FileSizeError):
+                await validate_upload_file(upload_file)
+        
+        # Oversized uploads are rejected before anything is copied to disk
+        assert spool_paths == []
 
 
 class TestOCRFallbackLogic:
@@ -327,12 +365,11 @@ class TestOCRFallbackLogic:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "test.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/test.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/test.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -372,12 +409,11 @@ class TestOCRFallbackLogic:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "test.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/test.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/test.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -414,12 +450,11 @@ class TestOCRFallbackLogic:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "test.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/test.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/test.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -35,12 +35,11 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "corrupted.pdf",
-                "content": corrupted_content
+                "content_path": "/tmp/corrupted.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/corrupted.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -71,12 +70,11 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 "safe_filename": "corrupted.docx",
-                "content": corrupted_content
+                "content_path": "/tmp/corrupted.docx"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/corrupted.docx"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -113,7 +111,7 @@ class TestErrorHandling:
             assert "exceeds maximum allowed size" in str(exc_info.value)
     
     @pytest.mark.asyncio
-    async def test_unsupported_file_type_error(self, document_service, mock_fastapi_upload_file):
+    async def test_unsupported_file_type_error(self, document_service, mock_fastapi_upload_file, temp_dir):
         """Test handling of unsupported file types"""
         # Create executable file content
         exe_content = b"MZ\x90\x00\x03\x00\x00\x00"  # PE header
@@ -123,7 +121,8 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "application/x-executable",
                 "safe_filename": "malware.exe",
-                "content": exe_content
+                # The real TemporaryFileManager deletes this, so keep it in a throwaway dir
+                "content_path": os.path.join(temp_dir, "malware.exe")
             }
             
             with pytest.raises(UnsupportedFormatError) as exc_info:
@@ -147,7 +146,7 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "passwd.pdf",  # Sanitized filename
-                "content": pdf_content
+                "content_path": "/tmp/passwd.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager, \
@@ -155,7 +154,6 @@ class TestErrorHandling:
                  patch('os.path.getsize', return_value=1024):
                 
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/passwd.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -181,7 +179,7 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "text/plain",
                 "safe_filename": "empty.txt",
-                "content": empty_content
+                "content_path": "/tmp/empty.txt"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager, \
@@ -189,7 +187,6 @@ class TestErrorHandling:
                  patch('os.path.getsize', return_value=0):
                 
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/empty.txt"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -228,12 +225,11 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "scanned.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/scanned.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/scanned.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -267,7 +263,7 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "text/plain",
                 "safe_filename": "invalid_encoding.txt",
-                "content": invalid_content
+                "content_path": "/tmp/invalid_encoding.txt"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager, \
@@ -275,8 +271,6 @@ class TestErrorHandling:
                  patch('os.path.getsize', return_value=len(invalid_content)):
                 
                 mock_context = Mock()
-                temp_path = "/tmp/invalid_encoding.txt"
-                mock_context.create_temp_file.return_value = temp_path
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -309,12 +303,11 @@ class TestErrorHandling:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "timeout.pdf",
-                "content": pdf_content
+                "content_path": "/tmp/timeout.pdf"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager:
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/timeout.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -337,7 +330,7 @@ class TestSpecificErrorScenarios:
         return DocumentService()
     
     @pytest.mark.asyncio
-    async def test_requirement_1_5_unsupported_format_error(self, document_service, mock_fastapi_upload_file):
+    async def test_requirement_1_5_unsupported_format_error(self, document_service, mock_fastapi_upload_file, temp_dir):
         """Test Requirement 1.5: Clear error message for unsupported formats"""
         # Test various unsupported formats
         unsupported_files = [
@@ -354,7 +347,8 @@ class TestSpecificErrorScenarios:
                 mock_validate.return_value = {
                     "detected_mime_type": mime_type,
                     "safe_filename": filename,
-                    "content": content
+                    # The real TemporaryFileManager deletes this, so keep it in a throwaway dir
+                    "content_path": os.path.join(temp_dir, filename)
                 }
                 
                 with pytest.raises(UnsupportedFormatError) as exc_info:
@@ -377,7 +371,7 @@ class TestSpecificErrorScenarios:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",
                 "safe_filename": "limit.pdf",
-                "content": limit_content
+                "content_path": "/tmp/limit.pdf"
             }
             
             # Mock successful processing
@@ -386,7 +380,6 @@ class TestSpecificErrorScenarios:
                  patch('os.path.getsize', return_value=len(limit_content)):
                 
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/limit.pdf"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
@@ -413,7 +406,7 @@ class TestSpecificErrorScenarios:
             mock_validate.return_value = {
                 "detected_mime_type": "application/pdf",  # Actual detected type
                 "safe_filename": "resume.txt",
-                "content": pdf_content
+                "content_path": "/tmp/resume.txt"
             }
             
             with patch('app.services.document_service.TemporaryFileManager') as mock_temp_manager, \
@@ -421,7 +414,6 @@ class TestSpecificErrorScenarios:
                  patch('os.path.getsize', return_value=len(pdf_content)):
                 
                 mock_context = Mock()
-                mock_context.create_temp_file.return_value = "/tmp/resume.txt"
                 mock_temp_manager.return_value.__enter__.return_value = mock_context
                 mock_temp_manager.return_value.__exit__.return_value = None
                 
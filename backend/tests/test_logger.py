@@ -0,0 +1,43 @@
+"""
+Unit tests for structured JSON logging
+"""
+import json
+import logging
+
+import numpy as np
+
+from app.utils.logger import StructuredFormatter
+
+
+class TestStructuredFormatter:
+    """Test cases for JSON log formatting"""
+    
+    def _make_record(self, **extra_fields) -> logging.LogRecord:
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname=__file__, lineno=1,
+            msg="metric_recorded", args=(), exc_info=None
+        )
+        record.extra_fields = extra_fields
+        return record
+    
+    def test_numpy_scalars_are_serialized_as_numbers(self):
+        """Test that numpy values stay numeric rather than falling back to str()"""
+        record = self._make_record(
+            p95_latency=np.float64(0.25),
+            error_count=np.int64(3),
+            latencies=np.array([0.1, 0.2])
+        )
+        
+        log_data = json.loads(StructuredFormatter().format(record))
+        
+        assert log_data["p95_latency"] == 0.25
+        assert log_data["error_count"] == 3
+        assert log_data["latencies"] == [0.1, 0.2]
+    
+    def test_unserializable_values_fall_back_to_str(self):
+        """Test that values orjson cannot encode are rendered with str()"""
+        record = self._make_record(value=complex(1, 2))
+        
+        log_data = json.loads(StructuredFormatter().format(record))
+        
+        assert log_data["value"] == "(1+2j)"
@@ -0,0 +1,55 @@
+"""
+Unit tests for the metrics collector
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from app.utils.metrics import MetricsCollector
+
+
+class TestMetricsCollector:
+    """Test cases for metric storage"""
+    
+    @pytest.fixture
+    def collector(self):
+        return MetricsCollector(max_history=100)
+    
+    @pytest.mark.asyncio
+    async def test_labelled_counter_increments_are_kept_per_label_set(self, collector):
+        """Test that counter increments with different labels do not overwrite each other"""
+        await collector.record_external_api_call("gemini", 0.2, success=True)
+        await collector.record_external_api_call("gemini", 0.3, success=False)
+        await collector.record_external_api_call("gemini", 0.1, success=True)
+        
+        summary = await collector.get_metrics_summary()
+        current = summary["current_metrics"]
+        assert current["external_api_calls_total{api=gemini,status=success}"]["value"] == 2
+        assert current["external_api_calls_total{api=gemini,status=error}"]["value"] == 1
+        
+        now = datetime.utcnow()
+        points = await collector.get_metrics_for_period(
+            "external_api_calls_total", now - timedelta(minutes=1), now + timedelta(minutes=1)
+        )
+        assert sorted(point.value for point in points) == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_gauge_history_keeps_every_sample(self, collector):
+        """Test that gauge samples stay available to the history endpoint"""
+        await collector.record_metrics({"system_cpu_percent": 10.0})
+        await collector.record_metrics({"system_cpu_percent": 20.0})
+        
+        now = datetime.utcnow()
+        points = await collector.get_metrics_for_period(
+            "system_cpu_percent", now - timedelta(minutes=1), now + timedelta(minutes=1)
+        )
+        assert [point.value for point in points] == [10.0, 20.0]
+    
+    @pytest.mark.asyncio
+    async def test_request_counters_accumulate(self, collector):
+        """Test that per-endpoint counters report running totals"""
+        await collector.record_request_latency("analyze", 0.1)
+        await collector.record_request_latency("analyze", 0.2, success=False)
+        
+        current = (await collector.get_metrics_summary())["current_metrics"]
+        assert current["analyze_requests_total"]["value"] == 2
+        assert current["analyze_errors_total"]["value"] == 1
@@ -243,10 +243,10 @@ class TestNERProcessor:
         assert "!" not in result
         assert "@" in result  # @ should be preserved for emails
         
-        # Test text truncation
+        # Long text is left for the tokenizer to truncate on a token boundary
         long_text = "x" * 6000
         result = ner_processor._preprocess_text(long_text)
-        assert len(result) == 5000
+        assert len(result) == 6000
 
 
 class TestEntityPostProcessor:
@@ -453,6 +453,12 @@ class TestEntityPostProcessor:
         assert 'name' in result
         assert result['name'] == 'John Doe'
 
+    def test_extract_experience_years(self, post_processor):
+        """Test years of experience are read from the full resume text"""
+        assert post_processor._extract_experience_years("Engineer with 7+ years of experience") == 7
+        assert post_processor._extract_experience_years("3 yrs in backend development") == 3
+        assert post_processor._extract_experience_years("No tenure mentioned here") is None
+
 
 class TestFallbackExtractor:
     """Test fallback extraction with edge cases and model failures"""
@@ -558,6 +564,7 @@ class TestFallbackExtractor:
         result = fallback_extractor._extract_contact_info_fallback(text_with_contact)
         
         assert result['email'] == 'john.doe@company.com'
+        assert result['phone'] == '5551234567'
         # Test that LinkedIn is extracted correctly
         assert result['linkedin'] == 'https://www.linkedin.com/in/johndoe'
         # Phone extraction may have regex issues, so we'll test it separately
@@ -690,7 +697,7 @@ class TestNLUService:
         # Verify method calls
         mock_ner.assert_called_once_with(sample_resume_text)
         mock_should_fallback.assert_called_once_with(mock_ner_entities)
-        mock_process.assert_called_once_with(mock_ner_entities)
+        mock_process.assert_called_once_with(mock_ner_entities, sample_resume_text)
     
     @patch('app.services.nlu_service.NERProcessor.extract_entities')
     @patch('app.services.nlu_service.FallbackExtractor.should_use_fallback')
@@ -748,6 +755,64 @@ class TestNLUService:
         mock_should_fallback.assert_called_once()
         mock_fallback_extract.assert_called_once()
     
+    @patch('app.services.nlu_service.NERProcessor.extract_entities')
+    @patch('app.services.nlu_service.FallbackExtractor.should_use_fallback')
+    @patch('app.services.nlu_service.FallbackExtractor.extract_fallback_entities')
+    @patch('app.services.nlu_service.EntityPostProcessor.process_entities')
+    @pytest.mark.asyncio
+    async def test_extract_entities_skips_fallback_when_ner_sufficient(self, mock_process, mock_fallback_extract, mock_should_fallback, mock_ner, nlu_service, sample_resume_text):
+        """Test that fallback is skipped when NER found enough skills and an email"""
+        mock_ner_entities = [
+            {'entity_group': 'SKILLS', 'word': skill, 'score': 0.65}
+            for skill in ['Python', 'TensorFlow', 'PyTorch', 'AWS', 'Docker']
+        ] + [{'entity_group': 'EMAIL', 'word': 'alice.johnson@aitech.com', 'score': 0.65}]
+        mock_ner.return_value = mock_ner_entities
+        mock_should_fallback.return_value = True
+        
+        ner_processed = ResumeEntities(
+            skills=['Python', 'TensorFlow', 'PyTorch', 'AWS', 'Docker'],
+            job_titles=[],
+            companies=[],
+            education=[],
+            contact_info={'email': 'alice.johnson@aitech.com'},
+            experience_years=None,
+            confidence_scores={'skills': 0.85}
+        )
+        mock_process.return_value = ner_processed
+        
+        result = await nlu_service.extract_entities(sample_resume_text)
+        
+        # The fallback may already have started alongside post-processing,
+        # but its result is discarded rather than merged
+        assert result is ner_processed
+    
+    @patch('app.services.nlu_service.NERProcessor.extract_entities')
+    @patch('app.services.nlu_service.FallbackExtractor.should_use_fallback')
+    @patch('app.services.nlu_service.FallbackExtractor.extract_fallback_entities')
+    @pytest.mark.asyncio
+    async def test_extract_entities_repeated_skill_tokens_still_use_fallback(self, mock_fallback_extract, mock_should_fallback, mock_ner, nlu_service, sample_resume_text):
+        """Test that repeated skill tokens count once, so the fallback still runs"""
+        # Same skill mentioned at five separate places in the resume
+        mock_ner.return_value = [
+            {'entity_group': 'SKILLS', 'word': 'Python', 'score': 0.65, 'start': offset, 'end': offset + 6}
+            for offset in range(0, 500, 100)
+        ] + [{'entity_group': 'EMAIL', 'word': 'alice.johnson@aitech.com', 'score': 0.65, 'start': 600, 'end': 624}]
+        mock_should_fallback.return_value = True
+        mock_fallback_extract.return_value = ResumeEntities(
+            skills=['TensorFlow', 'AWS'],
+            job_titles=[],
+            companies=[],
+            education=[],
+            contact_info={},
+            experience_years=None,
+            confidence_scores={'skills': 0.75}
+        )
+        
+        result = await nlu_service.extract_entities(sample_resume_text)
+        
+        mock_fallback_extract.assert_called_once()
+        assert result.skills == ['Python', 'TensorFlow', 'AWS']
+    
     @patch('app.services.nlu_service.NERProcessor.extract_entities')
     @patch('app.services.nlu_service.FallbackExtractor.extract_fallback_entities')
     @pytest.mark.asyncio
@@ -805,6 +870,8 @@ class TestNLUService:
         # Skills should be merged and deduplicated
         assert len(result.skills) == 4
         assert all(skill in result.skills for skill in ['Python', 'JavaScript', 'React', 'Docker'])
+        # NER skills come first and merge order is stable
+        assert result.skills == ['Python', 'JavaScript', 'React', 'Docker']
         
         # Job titles should prioritize NER (non-empty)
         assert result.job_titles == ['Software Engineer']